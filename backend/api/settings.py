@@ -111,6 +111,10 @@ async def update_settings(update: SettingsUpdate):
     
     current.update(update_data)
     save_settings(current)
+    
+    if "scan_extensions" in update_data:
+        from backend.services.scanner import reload_extensions
+        reload_extensions(update_data["scan_extensions"])
     logger.info(f"Settings updated: {update_data}")
     
     return await get_settings()
@@ -1070,9 +1070,9 @@ async def get_tagging_job_status(job_id: str):
 
 async def _apply_series_sync(track_ids, album, artist, genre, album_artist, cover_url):
     """Synchronous version for small batches"""
-    from backend.services.tagger import AudioTagger
+    from backend.services.tagger import get_tagger
     
-    tagger = AudioTagger()
+    tagger = get_tagger()
     written = 0
     errors = []
     successful_track_ids = []
@@ -1081,9 +1081,7 @@ async def _apply_series_sync(track_ids, album, artist, genre, album_artist, cove
     cover_data = None
     if cover_url:
         try:
-            cover_data = await tagger.download_cover_art(cover_url)
-            if cover_data:
-                cover_data = tagger.resize_cover_art(cover_data)
+            cover_data = await tagger.get_cover_art(cover_url)
         except Exception as e:
             logger.error(f"Failed to download cover art: {e}")
     
@@ -1153,21 +1151,20 @@ async def _apply_series_background(job_id, track_ids, album, artist, genre, albu
     """Background task for tagging large batches - processes files concurrently"""
     import asyncio
     from concurrent.futures import ThreadPoolExecutor
-    from backend.services.tagger import AudioTagger
+    from backend.services.tagger import get_tagger
     
     job = tagging_jobs[job_id]
     job['status'] = 'downloading_cover'
     
-    tagger = AudioTagger()
+    tagger = get_tagger()
     successful_track_ids = []
     
     # Download cover art once
     cover_data = None
     if cover_url:
         try:
-            cover_data = await tagger.download_cover_art(cover_url)
+            cover_data = await tagger.get_cover_art(cover_url)
             if cover_data:
-                cover_data = tagger.resize_cover_art(cover_data)
                 logger.info(f"[Job {job_id}] Downloaded cover art")
         except Exception as e:
             logger.error(f"[Job {job_id}] Failed to download cover art: {e}")
@@ -1270,13 +1267,13 @@ async def _apply_series_background(job_id, track_ids, album, artist, genre, albu
 async def resync_database():
     """Re-read file tags and update database to match actual file contents.
     This fixes any db/file mismatches by reading the actual tags from files."""
-    from backend.services.tagger import AudioTagger
+    from backend.services.tagger import get_tagger
     from mutagen import File as MutagenFile
     from mutagen.easyid3 import EasyID3
     from mutagen.mp4 import MP4
     from mutagen.flac import FLAC
     
-    tagger = AudioTagger()
+    tagger = get_tagger()
     updated = 0
     errors = []
     checked = 0
@@ -1368,9 +1365,9 @@ async def backfill_series_markers():
     This is useful after upgrading to ensure existing tagged tracks will be
     recognized on fresh installs.
     """
-    from backend.services.tagger import AudioTagger
+    from backend.services.tagger import get_tagger
     
-    tagger = AudioTagger()
+    tagger = get_tagger()
     updated = 0
     skipped = 0
     errors = []
@@ -1386,12 +1383,9 @@ async def backfill_series_markers():
         
         for track in tracks:
             try:
-                if not os.path.exists(track.filepath):
-                    skipped += 1
-                    continue
-                
                 # Write the series marker (this will add TIT1/GROUPING tag)
-                # We pass the existing album to trigger the marker write
+                # We pass the existing album to trigger the marker write; missing
+                # files are detected by write_album_artist and counted as skipped
                 album = track.album or track.matched_album
                 if album:
                     success = await tagger.write_album_artist(
@@ -15,15 +15,21 @@ class Settings(BaseSettings):
     
     # Scan settings
     scan_extensions: List[str] = ["mp3", "flac", "wav", "m4a", "aac", "ogg"]
+    scan_batch_size: int = 2000  # Rows per bulk INSERT when adding scanned tracks
     
     # Database
     database_url: str = ""
     
     # 1001Tracklists settings
     tracklists_delay: float = 2.0  # Delay between requests to avoid rate limiting
+    tracklists_concurrency: int = 3  # Browser pages open at once when fetching tracklists
     
     # Matching settings
     fuzzy_threshold: int = 50  # Minimum fuzzy match score (0-100)
+    match_concurrency: int = 4  # Tracks matched in parallel during batch matching
+    
+    # Tagging settings
+    tag_concurrency: int = 8  # Tracks tagged/renamed in parallel during batch operations
     
     # Filter settings
     min_duration_minutes: int = 0  # Minimum track duration in minutes (0 = no filter)
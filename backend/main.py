@@ -48,6 +48,14 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down SetList...")
+    
+    # Close the tagger's shared HTTP session
+    from backend.services.tagger import get_tagger
+    await get_tagger().aclose()
+    
+    # Close the 1001Tracklists browser so Chromium doesn't outlive the app
+    from backend.services.tracklists_api import close_tracklists_api
+    await close_tracklists_api()
 
 
 app = FastAPI(
@@ -3,7 +3,7 @@ Database service - SQLAlchemy async setup
 """
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import text
+from sqlalchemy import event, text
 from contextlib import asynccontextmanager
 from backend.config import settings
 from loguru import logger
@@ -14,9 +14,31 @@ Base = declarative_base()
 engine = create_async_engine(
     settings.database_url,
     echo=False,
-    future=True
+    future=True,
+    # Rows per INSERT ... RETURNING when the ORM flushes many new objects at
+    # once (e.g. match candidates); plain executemany inserts without
+    # RETURNING, like the scanner's, are not batched by this
+    insertmanyvalues_page_size=settings.scan_batch_size
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling with relaxed fsync on SQLite connections
+    
+    WAL lets readers (status polling, the UI) run alongside the scanner's bulk
+    inserts, and synchronous=NORMAL is safe in WAL mode: a power loss can drop
+    the last commits but never corrupts the database.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 # Create async session factory
 async_session = async_sessionmaker(
     engine,
@@ -35,23 +35,42 @@ class GoogleTracklistSearch:
     def __init__(self):
         self._playwright = None
         self._browser: Optional[Browser] = None
-        self.delay = 2.0  # Delay between requests
+        self._browser_lock = asyncio.Lock()
+        self.delay = 2.0  # Delay between requests to the same host
+        # Per-host pacing: pages on different sites don't wait on each other
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._next_request_at: Dict[str, float] = {}
         
     async def _get_browser(self) -> Browser:
         """Get or create browser instance"""
-        if self._browser is None or not self._browser.is_connected():
-            if self._playwright is None:
-                self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu'
-                ]
-            )
-        return self._browser
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+        # Concurrent matches must not each start Playwright and launch a browser
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=[
+                        '--no-sandbox',
+                        '--disable-setuid-sandbox',
+                        '--disable-dev-shm-usage',
+                        '--disable-gpu'
+                    ]
+                )
+            return self._browser
+    
+    async def _pace(self, url: str):
+        """Wait until the next request to this URL's host is allowed to start"""
+        host = urlparse(url).netloc
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            wait = self._next_request_at.get(host, 0.0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_request_at[host] = loop.time() + self.delay + random.uniform(0.5, 1.5)
     
     async def _fetch_page(self, url: str, wait_time: float = 2.0) -> Optional[BeautifulSoup]:
         """Fetch a page using Playwright"""
@@ -61,7 +80,7 @@ class GoogleTracklistSearch:
         )
         
         try:
-            await asyncio.sleep(self.delay + random.uniform(0.5, 1.5))
+            await self._pace(url)
             logger.debug(f"Fetching: {url}")
             
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
@@ -320,10 +339,9 @@ class GoogleTracklistSearch:
             
             # Parse "Artist - Title" format
             artist, title = "", track_text
-            if " - " in track_text:
-                parts = track_text.split(" - ", 1)
-                artist = parts[0].strip()
-                title = parts[1].strip() if len(parts) > 1 else ""
+            before, sep, after = track_text.partition(" - ")
+            if sep:
+                artist, title = before.strip(), after.strip()
             
             # Get time if available
             time_elem = row.select_one('span.cueValueField, span.timeValue')
@@ -3,18 +3,34 @@ Fuzzy matching service - matches local tracks with tracklist information
 Uses Google search to find tracklists from various sources
 """
 import re
+import heapq
 import asyncio
-from typing import List, Dict, Optional, Tuple
+from operator import itemgetter
+from typing import List, Dict, Optional, Set, Tuple
+from unicodedata import normalize
 from rapidfuzz import fuzz, process
 from sqlalchemy import select
 from backend.services.database import get_db
-from backend.services.tracklists_api import search_1001tracklists, get_tracklist_details
+from backend.services.tracklists_api import search_1001tracklists, get_tracklists_details
 from backend.services.google_search import search_tracklists_google
 from backend.models.track import Track, MatchCandidate
 from backend.config import settings
 from loguru import logger
 
 
+# clean_string lowercases its input before these run, so they are compiled
+# without re.IGNORECASE and must stay lowercase
+_EXTENSION_RE = re.compile(r'\.(mp3|flac|wav|m4a|aac|ogg)$')
+
+_PATTERNS_TO_REMOVE = [
+    re.compile(r'\d{4}[-./]\d{2}[-./]\d{2}'),  # Dates
+    re.compile(r'\d{2}[-./]\d{2}[-./]\d{4}'),  # Dates (alternate)
+    re.compile(r'\b(live|set|mix|dj|@|podcast|episode|ep\.?|vol\.?)\b'),
+    re.compile(r'\b(320|128|flac|wav|mp3)\b'),  # Quality indicators
+    re.compile(r'\b(part|pt\.?)\s*\d+\b'),       # Part numbers
+]
+
+
 class TrackMatcher:
     """Fuzzy matching engine for DJ tracks"""
     
@@ -26,8 +42,8 @@ class TrackMatcher:
         if not s:
             return ""
         
-        # Convert to lowercase
-        s = s.lower()
+        # Fold composed/decomposed accents to one form, then lowercase
+        s = normalize("NFKC", s).lower()
         
         # Remove common file artifacts
         s = re.sub(r'\[.*?\]', '', s)  # Remove [anything in brackets]
@@ -36,22 +52,14 @@ class TrackMatcher:
         s = re.sub(r'-{2,}', ' ', s)   # Replace multiple dashes
         
         # Remove file extensions
-        s = re.sub(r'\.(mp3|flac|wav|m4a|aac|ogg)$', '', s, flags=re.IGNORECASE)
+        s = _EXTENSION_RE.sub('', s)
         
         # Remove common DJ set prefixes/suffixes
-        patterns_to_remove = [
-            r'\d{4}[-./]\d{2}[-./]\d{2}',  # Dates
-            r'\d{2}[-./]\d{2}[-./]\d{4}',  # Dates (alternate)
-            r'\b(live|set|mix|dj|@|podcast|episode|ep\.?|vol\.?)\b',
-            r'\b(320|128|flac|wav|mp3)\b',  # Quality indicators
-            r'\b(part|pt\.?)\s*\d+\b',       # Part numbers
-        ]
-        
-        for pattern in patterns_to_remove:
-            s = re.sub(pattern, '', s, flags=re.IGNORECASE)
+        for pattern in _PATTERNS_TO_REMOVE:
+            s = pattern.sub('', s)
         
         # Clean up whitespace
-        s = re.sub(r'\s+', ' ', s).strip()
+        s = ' '.join(s.split())
         
         return s
     
@@ -94,7 +102,8 @@ class TrackMatcher:
         match_type: str = "fuzzy"
     ) -> float:
         """Calculate a match confidence score between a track and a candidate"""
-        scores = []
+        weighted_sum = 0.0
+        total_weight = 0.0
         
         track_artist = self.clean_string(track.artist or "")
         track_title = self.clean_string(track.title or track.filename)
@@ -105,32 +114,33 @@ class TrackMatcher:
         # Title match
         if track_title and candidate_title:
             title_score = fuzz.token_set_ratio(track_title, candidate_title)
-            scores.append(("title", title_score, 0.5))  # 50% weight
+            weighted_sum += title_score * 0.5  # 50% weight
+            total_weight += 0.5
         
         # Artist match (if available)
         if track_artist and candidate_artist:
             artist_score = fuzz.token_set_ratio(track_artist, candidate_artist)
-            scores.append(("artist", artist_score, 0.3))  # 30% weight
+            weighted_sum += artist_score * 0.3  # 30% weight
+            total_weight += 0.3
         
         # Full name match (filename vs full title)
         track_full = self.clean_string(track.filename)
         candidate_full = self.clean_string(candidate.get("full_title", candidate.get("title", "")))
         if track_full and candidate_full:
             full_score = fuzz.token_set_ratio(track_full, candidate_full)
-            scores.append(("full", full_score, 0.2))  # 20% weight
+            weighted_sum += full_score * 0.2  # 20% weight
+            total_weight += 0.2
         
         # Calculate weighted average
-        if not scores:
+        if not total_weight:
             return 0.0
         
-        total_weight = sum(s[2] for s in scores)
-        weighted_score = sum(s[1] * s[2] for s in scores) / total_weight
-        
-        return weighted_score
+        return weighted_sum / total_weight
     
     async def find_matches_for_track(self, track: Track) -> List[Dict]:
         """Find potential matches for a track using Google search"""
-        matches = []
+        matches: List[Dict] = []
+        seen_urls: Set[str] = set()
         
         # Extract search terms
         search_terms = self.extract_search_terms(track)
@@ -191,11 +201,11 @@ class TrackMatcher:
                         "match_type": "google_search"
                     }
                     matches.append(match_data)
+                    seen_urls.add(match_data["url"])
             
             # FALLBACK: If Google didn't find enough results, try direct 1001tracklists
             if len(matches) < 2:
                 logger.info("Trying direct 1001tracklists search as fallback...")
-                seen_urls = set(m.get("url", "") for m in matches)
                 
                 for term in search_terms[:2]:
                     try:
@@ -225,16 +235,15 @@ class TrackMatcher:
             logger.error(f"Error in Google search: {e}")
             # Fall back to 1001tracklists only
             logger.info("Falling back to 1001tracklists search only...")
-            await self._fallback_search(track, search_terms, matches)
+            await self._fallback_search(track, search_terms, matches, seen_urls)
         
-        # Sort by confidence
-        matches.sort(key=lambda x: x.get("confidence", 0), reverse=True)
-        
-        return matches[:10]  # Return top 10 matches
+        # Return top 10 matches by confidence
+        return heapq.nlargest(10, matches, key=itemgetter("confidence"))
     
     def _calculate_google_result_score(self, track: Track, result: Dict) -> float:
         """Calculate match score for a Google search result"""
-        scores = []
+        weighted_sum = 0.0
+        total_weight = 0.0
         
         track_artist = self.clean_string(track.artist or "")
         track_title = self.clean_string(track.title or track.filename)
@@ -245,37 +254,42 @@ class TrackMatcher:
         # Title match
         if track_title and result_title:
             title_score = fuzz.token_set_ratio(track_title, result_title)
-            scores.append(("title", title_score, 0.4))
+            weighted_sum += title_score * 0.4
+            total_weight += 0.4
         
         # Artist match
         if track_artist and result_artist:
             artist_score = fuzz.token_set_ratio(track_artist, result_artist)
-            scores.append(("artist", artist_score, 0.3))
+            weighted_sum += artist_score * 0.3
+            total_weight += 0.3
         
         # Filename vs full title
         track_full = self.clean_string(track.filename)
         if track_full and result_title:
             full_score = fuzz.token_set_ratio(track_full, result_title)
-            scores.append(("full", full_score, 0.2))
+            weighted_sum += full_score * 0.2
+            total_weight += 0.2
         
         # Bonus for having tracks
         num_tracks = len(result.get("tracks", []))
         if num_tracks > 0:
             track_bonus = min(num_tracks * 2, 20)  # Up to 20 bonus points
-            scores.append(("tracks", track_bonus + 50, 0.1))
+            weighted_sum += (track_bonus + 50) * 0.1
+            total_weight += 0.1
         
-        if not scores:
+        if not total_weight:
             return 0.0
         
-        total_weight = sum(s[2] for s in scores)
-        weighted_score = sum(s[1] * s[2] for s in scores) / total_weight
-        
-        return weighted_score
+        return weighted_sum / total_weight
     
-    async def _fallback_search(self, track: Track, search_terms: List[str], matches: List[Dict]):
-        """Fallback to 1001tracklists direct search"""
-        seen_urls = set(m.get("url", "") for m in matches)
-        
+    async def _fallback_search(
+        self,
+        track: Track,
+        search_terms: List[str],
+        matches: List[Dict],
+        seen_urls: Set[str]
+    ):
+        """Fallback to 1001tracklists direct search, skipping URLs already in seen_urls"""
         for term in search_terms[:3]:
             try:
                 logger.info(f"Searching 1001tracklists for: {term}")
@@ -303,39 +317,51 @@ class TrackMatcher:
             except Exception as e:
                 logger.error(f"Error searching for term '{term}': {e}")
     
-    async def enrich_match_with_tracklist_details(self, match: Dict) -> Dict:
-        """Fetch full tracklist details for a match"""
-        url = match.get("url")
-        if not url or "/tracklist/" not in url:
-            return match
+    async def enrich_matches_with_tracklist_details(self, matches: List[Dict]) -> List[Dict]:
+        """Fetch full tracklist details for several matches in one batch"""
+        urls = [
+            m.get("url") for m in matches
+            if m.get("url") and "/tracklist/" in m.get("url")
+        ]
+        if not urls:
+            return matches
         
         try:
-            details = await get_tracklist_details(url)
-            if details:
-                match.update({
-                    "cover_url": details.get("cover_url"),
-                    "djs": details.get("djs", []),
-                    "genres": details.get("genres", []),
-                    "date_recorded": details.get("date_recorded"),
-                    "sources": details.get("sources", {}),
-                    "num_tracks": details.get("num_tracks", 0)
-                })
-                
-                # Set primary values
-                if details.get("djs"):
-                    match["dj"] = details["djs"][0]
-                if details.get("genres"):
-                    match["genre"] = details["genres"][0]
-                if details.get("sources"):
-                    # Get event name if available
-                    for key, value in details["sources"].items():
-                        if "festival" in key.lower() or "event" in key.lower():
-                            match["event"] = value
-                            break
+            # Independent pages, fetched concurrently under the API's page limit
+            details_by_url = await get_tracklists_details(urls)
         except Exception as e:
-            logger.error(f"Error enriching match: {e}")
+            logger.error(f"Error enriching matches: {e}")
+            return matches
         
-        return match
+        for match in matches:
+            details = details_by_url.get(match.get("url"))
+            if details:
+                self._apply_tracklist_details(match, details)
+        
+        return matches
+    
+    def _apply_tracklist_details(self, match: Dict, details: Dict):
+        """Copy tracklist details onto a match"""
+        match.update({
+            "cover_url": details.get("cover_url"),
+            "djs": details.get("djs", []),
+            "genres": details.get("genres", []),
+            "date_recorded": details.get("date_recorded"),
+            "sources": details.get("sources", {}),
+            "num_tracks": details.get("num_tracks", 0)
+        })
+        
+        # Set primary values
+        if details.get("djs"):
+            match["dj"] = details["djs"][0]
+        if details.get("genres"):
+            match["genre"] = details["genres"][0]
+        if details.get("sources"):
+            # Get event name if available
+            for key, value in details["sources"].items():
+                if "festival" in key.lower() or "event" in key.lower():
+                    match["event"] = value
+                    break
 
 
 # Global matcher instance
@@ -375,9 +401,8 @@ async def find_matches(track_id: int):
                 await db.commit()
                 return
             
-            # Enrich top matches with tracklist details
-            for i, match in enumerate(matches[:3]):
-                matches[i] = await matcher.enrich_match_with_tracklist_details(match)
+            # Enrich top matches with tracklist details (fetched as one batch)
+            await matcher.enrich_matches_with_tracklist_details(matches[:3])
             
             # Clear existing match candidates
             await db.execute(
@@ -452,6 +477,12 @@ async def batch_match_tracks(
     
     logger.info(f"Batch matching {len(ids_to_match)} tracks")
     
-    for track_id in ids_to_match:
-        await find_matches(track_id)
-        await asyncio.sleep(2.0)  # Delay between tracks to avoid rate limiting
+    # Overlap search latency across tracks; per-request delays in the search
+    # services still throttle each host
+    semaphore = asyncio.Semaphore(max(1, settings.match_concurrency))
+    
+    async def match_one(track_id: int):
+        async with semaphore:
+            await find_matches(track_id)
+    
+    await asyncio.gather(*(match_one(track_id) for track_id in ids_to_match))
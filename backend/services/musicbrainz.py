@@ -3,13 +3,26 @@ MusicBrainz API service for album/CD lookups
 """
 import aiohttp
 import asyncio
+from collections import Counter
+from cachetools import TTLCache
 from loguru import logger
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
+from unicodedata import normalize
 
 # MusicBrainz API endpoint
 MUSICBRAINZ_API = "https://musicbrainz.org/ws/2"
 USER_AGENT = "SetList/1.0 (https://github.com/jvenuto80/setlist)"
 
+# Release track listings and cover art rarely change, so cache them per release
+# to avoid spending the 1 req/s rate limit on repeat lookups
+_release_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_cover_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+
+
+def _nfkc(value: Optional[str]) -> str:
+    """Normalize a MusicBrainz text field to NFKC so it compares consistently"""
+    return normalize("NFKC", value) if value else ""
+
 
 async def search_album(query: str, artist: str = None, limit: int = 10) -> List[Dict]:
     """
@@ -57,13 +70,13 @@ async def search_album(query: str, artist: str = None, limit: int = 10) -> List[
                         artists = []
                         for ac in artist_credit:
                             if 'artist' in ac:
-                                artists.append(ac['artist'].get('name', ''))
+                                artists.append(_nfkc(ac['artist'].get('name', '')))
                         artist_name = ', '.join(artists) if artists else ''
                         
                         # Get release info
                         result = {
                             'id': release.get('id'),
-                            'title': release.get('title', ''),
+                            'title': _nfkc(release.get('title', '')),
                             'artist': artist_name,
                             'date': release.get('date', ''),
                             'country': release.get('country', ''),
@@ -77,7 +90,7 @@ async def search_album(query: str, artist: str = None, limit: int = 10) -> List[
                         # Get label info if available
                         label_info = release.get('label-info', [])
                         if label_info:
-                            labels = [li.get('label', {}).get('name', '') for li in label_info if li.get('label')]
+                            labels = [_nfkc(li.get('label', {}).get('name', '')) for li in label_info if li.get('label')]
                             result['label'] = ', '.join(labels)
                         
                         results.append(result)
@@ -104,6 +117,9 @@ async def get_release_tracks(release_id: str) -> List[Dict]:
     Returns:
         List of tracks with title, position, duration
     """
+    if release_id in _release_cache:
+        return list(_release_cache[release_id])
+    
     tracks = []
     
     try:
@@ -133,10 +149,12 @@ async def get_release_tracks(release_id: str) -> List[Dict]:
                             tracks.append({
                                 'position': track.get('position', 0),
                                 'disc': disc_number,
-                                'title': track.get('title', ''),
+                                'title': _nfkc(track.get('title', '')),
                                 'duration_ms': track.get('length'),
                                 'recording_id': track.get('recording', {}).get('id'),
                             })
+                    
+                    _release_cache[release_id] = list(tracks)
                             
     except Exception as e:
         logger.error(f"Error getting release tracks from MusicBrainz: {e}")
@@ -160,7 +178,8 @@ async def search_by_tracks(track_names: List[str], limit: int = 5) -> List[Dict]
     
     try:
         # Search for each track and collect release info
-        release_scores = {}  # release_id -> {info, match_count}
+        match_counts: Counter = Counter()  # release_id -> match_count
+        release_info: Dict[str, Tuple[str, str, int]] = {}  # release_id -> (title, artist, track_count)
         
         headers = {
             'User-Agent': USER_AGENT,
@@ -194,23 +213,21 @@ async def search_by_tracks(track_names: List[str], limit: int = 5) -> List[Dict]
                                 for release in recording.get('releases', []):
                                     release_id = release.get('id')
                                     if release_id:
-                                        if release_id not in release_scores:
+                                        if release_id not in release_info:
                                             # Extract artist info
                                             artist_credit = recording.get('artist-credit', [])
                                             artists = []
                                             for ac in artist_credit:
                                                 if 'artist' in ac:
-                                                    artists.append(ac['artist'].get('name', ''))
+                                                    artists.append(_nfkc(ac['artist'].get('name', '')))
                                             artist_name = ', '.join(artists) if artists else ''
                                             
-                                            release_scores[release_id] = {
-                                                'id': release_id,
-                                                'title': release.get('title', ''),
-                                                'artist': artist_name,
-                                                'track_count': release.get('track-count', 0),
-                                                'match_count': 0
-                                            }
-                                        release_scores[release_id]['match_count'] += 1
+                                            release_info[release_id] = (
+                                                _nfkc(release.get('title', '')),
+                                                artist_name,
+                                                release.get('track-count', 0)
+                                            )
+                                        match_counts[release_id] += 1
                                         
                 except Exception as e:
                     logger.warning(f"Error searching for track '{track_name}': {e}")
@@ -218,13 +235,16 @@ async def search_by_tracks(track_names: List[str], limit: int = 5) -> List[Dict]
                 # Rate limiting - MusicBrainz allows 1 request per second
                 await asyncio.sleep(1.1)
         
-        # Sort by number of matching tracks
-        sorted_releases = sorted(
-            release_scores.values(),
-            key=lambda x: -x['match_count']
-        )
-        
-        results = sorted_releases[:limit]
+        # Build result dicts only for the releases with the most matching tracks
+        for release_id, match_count in match_counts.most_common(limit):
+            title, artist_name, track_count = release_info[release_id]
+            results.append({
+                'id': release_id,
+                'title': title,
+                'artist': artist_name,
+                'track_count': track_count,
+                'match_count': match_count
+            })
         
     except Exception as e:
         logger.error(f"Error searching MusicBrainz by tracks: {e}")
@@ -242,6 +262,11 @@ async def get_cover_art_url(release_id: str) -> Optional[str]:
     Returns:
         URL to cover art image or None
     """
+    if release_id in _cover_cache:
+        return _cover_cache[release_id]
+    
+    cover_url = None
+    
     try:
         headers = {
             'User-Agent': USER_AGENT,
@@ -258,16 +283,18 @@ async def get_cover_art_url(release_id: str) -> Optional[str]:
                     data = await response.json()
                     images = data.get('images', [])
                     
-                    # Prefer front cover
-                    for img in images:
-                        if img.get('front'):
-                            return img.get('image') or img.get('thumbnails', {}).get('large')
+                    # Prefer front cover, fall back to first image
+                    front = next((img for img in images if img.get('front')), None)
+                    image = front or (images[0] if images else None)
+                    if image:
+                        cover_url = image.get('image') or image.get('thumbnails', {}).get('large')
                     
-                    # Fall back to first image
-                    if images:
-                        return images[0].get('image') or images[0].get('thumbnails', {}).get('large')
+                    _cover_cache[release_id] = cover_url
+                elif response.status == 404:
+                    # Release has no cover art
+                    _cover_cache[release_id] = None
                         
     except Exception as e:
         logger.debug(f"No cover art found for release {release_id}: {e}")
     
-    return None
+    return cover_url
@@ -2,35 +2,104 @@
 Directory scanner service - scans directories for audio files
 """
 import os
+import re
 import json
 import asyncio
+import multiprocessing
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from typing import Callable, Optional, List, Tuple, FrozenSet
 from mutagen import File as MutagenFile
 from mutagen.easyid3 import EasyID3
 from mutagen.mp3 import MP3
 from mutagen.flac import FLAC
-from sqlalchemy import select
-from backend.services.database import get_db
+from mutagen.easymp4 import EasyMP4
+from mutagen.oggvorbis import OggVorbis
+from sqlalchemy import select, or_, text, insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from backend.services.database import engine
 from backend.models.track import Track
 from backend.config import settings
 from loguru import logger
 
 # Scan state
-_scan_status = {
-    "running": False,
-    "progress": 0,
-    "total": 0,
-    "current_file": None,
-    "files_found": 0,
-    "files_added": 0,
-    "files_skipped": 0,
-    "files_filtered": 0,
-    "errors": []
-}
+@dataclass(slots=True)
+class ScanStatus:
+    """Progress counters for the current (or last) scan"""
+    running: bool = False
+    progress: int = 0
+    total: int = 0
+    current_file: Optional[str] = None
+    files_found: int = 0
+    files_added: int = 0
+    files_skipped: int = 0
+    files_filtered: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+_scan_status = ScanStatus()
 _scan_stop_flag = False
 
+# Metadata extraction runs in worker processes (tag parsing is CPU-bound
+# Python), in chunks of files, with a bounded number of chunks queued ahead
+# of the insert loop
+METADATA_WORKERS = os.cpu_count() or 1
+METADATA_CHUNK_SIZE = 32
+METADATA_WINDOW = METADATA_WORKERS * 2
+
+# Lowest bitrate (bits/s) assumed when ruling out files by size: 6 kbps is
+# the floor for Opus (MP3's is 8 kbps), so no file plays longer than
+# size * 8 / this seconds
+MIN_AUDIO_BITRATE = 6000
+
+# Directory listings the walker may queue ahead of metadata extraction
+DISCOVERY_QUEUE_SIZE = 1000
+
+
+def _insert_new_tracks(dialect: str):
+    """INSERT into tracks that leaves rows with an existing filepath alone
+    
+    Uses the dialect's ON CONFLICT / IGNORE form; other backends get a plain
+    INSERT, where a duplicate fails (and rolls back) the batch.
+    """
+    if dialect == "sqlite":
+        return sqlite_insert(Track.__table__).on_conflict_do_nothing(index_elements=["filepath"])
+    if dialect == "postgresql":
+        return pg_insert(Track.__table__).on_conflict_do_nothing(index_elements=["filepath"])
+    if dialect in ("mysql", "mariadb"):
+        return insert(Track.__table__).prefix_with("IGNORE")
+    return insert(Track.__table__)
+
+
+@asynccontextmanager
+async def _bulk_insert_cache(conn):
+    """Give a SQLite connection a larger page cache (64 MiB) while bulk inserting
+    
+    PRAGMA cache_size is per connection, so conn must stay checked out for
+    the whole bulk insert. It goes back to the pool afterwards, so its
+    previous cache size is restored on the way out. Other databases are
+    left untouched.
+    """
+    if conn.dialect.name != "sqlite":
+        yield
+        return
+    
+    previous = (await conn.execute(text("PRAGMA cache_size"))).scalar()
+    await conn.execute(text("PRAGMA cache_size=-65536"))
+    try:
+        yield
+    finally:
+        try:
+            await conn.execute(text(f"PRAGMA cache_size={int(previous)}"))
+        except Exception as e:
+            logger.warning(f"Could not restore SQLite cache_size: {e}")
+
 
 def get_min_duration_setting() -> int:
     """Get minimum duration setting from saved settings"""
@@ -42,6 +111,36 @@ def get_min_duration_setting() -> int:
     return 0
 
 
+def _existing_dirs(paths: List[str]) -> List[str]:
+    """Filter paths down to existing directories, keeping their order
+    
+    Paths sharing a parent are resolved from one os.scandir of that parent
+    (DirEntry.is_dir needs no extra stat) instead of a stat per path.
+    """
+    by_parent = defaultdict(list)
+    for path in paths:
+        if path:
+            by_parent[os.path.dirname(os.path.normpath(path))].append(path)
+    
+    is_dir = {}
+    for parent, children in by_parent.items():
+        if len(children) > 1:
+            try:
+                with os.scandir(parent) as it:
+                    subdirs = {entry.name for entry in it if entry.is_dir()}
+                for child in children:
+                    name = os.path.basename(os.path.normpath(child))
+                    # The filesystem root has no name in its parent's listing
+                    is_dir[child] = name in subdirs if name else os.path.isdir(child)
+                continue
+            except OSError:
+                pass
+        for child in children:
+            is_dir[child] = os.path.isdir(child)
+    
+    return [path for path in paths if path and is_dir[path]]
+
+
 def get_music_dirs() -> List[str]:
     """Get list of music directories from saved settings"""
     settings_file = os.path.join(settings.config_dir, "settings.json")
@@ -50,20 +149,18 @@ def get_music_dirs() -> List[str]:
             saved = json.load(f)
             music_dirs = saved.get("music_dirs", [])
             if music_dirs:
-                return [d for d in music_dirs if d and os.path.exists(d)]
+                return _existing_dirs(music_dirs)
             # Fallback to single music_dir
             music_dir = saved.get("music_dir", settings.music_dir)
-            if music_dir and os.path.exists(music_dir):
-                return [music_dir]
+            if music_dir:
+                return _existing_dirs([music_dir])
     # Default
-    if os.path.exists(settings.music_dir):
-        return [settings.music_dir]
-    return []
+    return _existing_dirs([settings.music_dir])
 
 
 async def get_scan_status():
     """Get current scan status"""
-    return _scan_status.copy()
+    return asdict(_scan_status)
 
 
 async def stop_current_scan():
@@ -72,13 +169,126 @@ async def stop_current_scan():
     _scan_stop_flag = True
 
 
-def get_audio_extensions():
-    """Get list of audio file extensions to scan"""
-    return [f".{ext}" for ext in settings.scan_extensions]
+def _normalize_extensions(extensions: List[str]) -> FrozenSet[str]:
+    """Lowercase extensions and strip the leading dot, for fast membership checks"""
+    return frozenset(ext.strip().lstrip(".").lower() for ext in extensions if ext.strip())
+
+
+def get_scan_extensions_setting() -> List[str]:
+    """Get scan extensions from saved settings, falling back to the configured defaults"""
+    settings_file = os.path.join(settings.config_dir, "settings.json")
+    if os.path.exists(settings_file):
+        try:
+            with open(settings_file, "r") as f:
+                saved = json.load(f)
+            return saved.get("scan_extensions") or settings.scan_extensions
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read scan extensions from {settings_file}: {e}")
+    return settings.scan_extensions
+
+
+# Extensions to scan, normalized once rather than per scan or per file
+_EXT_SET: FrozenSet[str] = _normalize_extensions(get_scan_extensions_setting())
+
+
+def reload_extensions(extensions: Optional[List[str]] = None):
+    """Rebuild the scanned extension set, e.g. after the settings change"""
+    global _EXT_SET
+    _EXT_SET = _normalize_extensions(extensions if extensions is not None else get_scan_extensions_setting())
+
+
+def _has_audio_extension(name: str, extensions: FrozenSet[str]) -> bool:
+    """Check a filename's extension against a set of lowercase, dotless extensions"""
+    dot = name.rfind(".")
+    return dot >= 0 and name[dot + 1:].lower() in extensions
+
+
+def _list_directory(path: str, extensions: FrozenSet[str]) -> Tuple[List[Tuple[str, int]], List[str]]:
+    """List one directory, returning ((audio file, size) pairs, subdirectories)"""
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif _has_audio_extension(entry.name, extensions) and entry.is_file():
+                    # Keep the size from the DirEntry stat so it isn't looked up again later
+                    files.append((entry.path, entry.stat().st_size))
+    except OSError as e:
+        logger.warning(f"Could not read directory {path}: {e}")
+    return files, subdirs
+
+
+def find_audio_files(
+    directories: List[str],
+    extensions: FrozenSet[str],
+    on_files: Callable[[List[Tuple[str, int]]], None],
+    stop: Optional[threading.Event] = None
+):
+    """Walk directories for audio files, listing subdirectories in parallel
+    
+    Each directory listing runs on a worker thread and its subdirectories are
+    submitted back to the pool, so slow (network) filesystems are read with
+    several requests in flight instead of one at a time. The directories
+    must already be known to exist (see get_music_dirs). Matching
+    (path, size) pairs are passed to on_files one directory at a time. No
+    further directories are listed once the scan is stopped or stop is set.
+    """
+    max_workers = min(60, 2 * (os.cpu_count() or 1))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for scan_dir in directories:
+            logger.info(f"Scanning: {scan_dir}")
+            pending.add(executor.submit(_list_directory, scan_dir, extensions))
+        
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                if files:
+                    on_files(files)
+                if _scan_stop_flag or (stop is not None and stop.is_set()):
+                    continue
+                for subdir in subdirs:
+                    pending.add(executor.submit(_list_directory, subdir, extensions))
+
+
+def _open_easy_mp3(filepath: str) -> MP3:
+    """Open an MP3 with EasyID3 tag access"""
+    return MP3(filepath, ID3=EasyID3)
+
+
+# Format-specific parsers keyed by extension, so MutagenFile doesn't have to
+# sniff each file's header to pick one. Anything else falls back to MutagenFile.
+_PARSERS = {
+    "mp3": _open_easy_mp3,
+    "flac": FLAC,
+    "ogg": OggVorbis,
+    "m4a": EasyMP4,
+    "mp4": EasyMP4,
+}
 
 
-def extract_metadata_from_file(filepath: str) -> dict:
-    """Extract metadata from audio file using mutagen"""
+def _open_audio(filepath: str, file_format: str):
+    """Open an audio file with easy tag access, dispatching on its extension"""
+    parser = _PARSERS.get(file_format)
+    if parser is not None:
+        try:
+            return parser(filepath)
+        except Exception:
+            # Extension doesn't match the content (e.g. Opus in .ogg), let mutagen sniff it
+            pass
+    return MutagenFile(filepath, easy=True)
+
+
+def extract_metadata_from_file(filepath: str, min_seconds: float = 0) -> dict:
+    """Extract metadata from audio file using mutagen
+    
+    If min_seconds is set and the file is shorter, only the stream info is
+    filled in and the tag reads are skipped, since the file will be filtered.
+    """
     metadata = {
         "title": None,
         "artist": None,
@@ -93,13 +303,14 @@ def extract_metadata_from_file(filepath: str) -> dict:
     }
     
     try:
-        audio = MutagenFile(filepath, easy=True)
+        file_format = Path(filepath).suffix.lower().lstrip(".")
+        audio = _open_audio(filepath, file_format)
         
         if audio is None:
             return metadata
         
         # Get format
-        metadata["file_format"] = Path(filepath).suffix.lower().lstrip(".")
+        metadata["file_format"] = file_format
         
         # Get duration
         if hasattr(audio, "info") and hasattr(audio.info, "length"):
@@ -113,6 +324,10 @@ def extract_metadata_from_file(filepath: str) -> dict:
         if hasattr(audio, "info") and hasattr(audio.info, "sample_rate"):
             metadata["sample_rate"] = audio.info.sample_rate
         
+        # Too short to be kept, don't bother with the tags
+        if min_seconds and metadata["duration"] and metadata["duration"] < min_seconds:
+            return metadata
+        
         # Try to get tags
         if audio is not None:
             metadata["title"] = audio.get("title", [None])[0]
@@ -163,6 +378,25 @@ def extract_metadata_from_file(filepath: str) -> dict:
     return metadata
 
 
+def extract_metadata_batch(filepaths: List[str], min_seconds: float = 0) -> List[dict]:
+    """Extract metadata for several files in one worker-process round trip"""
+    return [extract_metadata_from_file(filepath, min_seconds) for filepath in filepaths]
+
+
+def is_too_small_for_duration(file_size: int, min_seconds: float) -> bool:
+    """Whether a file is too small to reach min_seconds even at the lowest bitrate
+    
+    Lets files that are certainly too short be filtered from their size alone,
+    without opening them.
+    """
+    return file_size * 8 < min_seconds * MIN_AUDIO_BITRATE
+
+
+# "Artist - Title" takes precedence over "Artist @ Event": the first branch
+# matches whenever the name contains " - " anywhere
+_FILENAME_SPLIT_RE = re.compile(r"(.*?) - (.*)|(.*?) @ (.*)", re.DOTALL)
+
+
 def parse_filename_for_metadata(filename: str) -> dict:
     """Parse filename to extract potential metadata"""
     metadata = {
@@ -179,18 +413,12 @@ def parse_filename_for_metadata(filename: str) -> dict:
     # "Artist - Event - Date"
     # "Artist - Mix Name"
     
-    # Try splitting by " - "
-    if " - " in name:
-        parts = name.split(" - ", 1)
-        metadata["artist"] = parts[0].strip()
-        metadata["title"] = parts[1].strip() if len(parts) > 1 else None
-    
-    # Try splitting by " @ "
-    elif " @ " in name:
-        parts = name.split(" @ ", 1)
-        metadata["artist"] = parts[0].strip()
-        metadata["title"] = parts[1].strip() if len(parts) > 1 else None
-    
+    # Split at the first " - ", or failing that the first " @ "
+    match = _FILENAME_SPLIT_RE.fullmatch(name)
+    if match:
+        artist, title = (match.group(1, 2) if match.group(1) is not None else match.group(3, 4))
+        metadata["artist"] = artist.strip()
+        metadata["title"] = title.strip()
     else:
         # Use whole filename as title
         metadata["title"] = name.strip()
@@ -207,139 +435,219 @@ async def scan_directory(directory: str = None):
     global _scan_status, _scan_stop_flag
     
     _scan_stop_flag = False
-    _scan_status = {
-        "running": True,
-        "progress": 0,
-        "total": 0,
-        "current_file": None,
-        "files_found": 0,
-        "files_added": 0,
-        "files_skipped": 0,
-        "files_filtered": 0,
-        "errors": []
-    }
+    _scan_status = ScanStatus(running=True)
     
     # Determine directories to scan
     if directory:
-        directories = [directory]
+        directories = _existing_dirs([directory])
+        if not directories:
+            logger.warning(f"Directory does not exist, skipping: {directory}")
     else:
         directories = get_music_dirs()
     
     if not directories:
         logger.error("No valid music directories configured")
-        _scan_status["errors"].append("No valid music directories configured")
-        _scan_status["running"] = False
+        _scan_status.errors.append("No valid music directories configured")
+        _scan_status.running = False
         return
     
-    extensions = get_audio_extensions()
-    audio_files: List[str] = []
+    extensions = _EXT_SET
     
     logger.info(f"Scanning directories: {directories}")
-    logger.info(f"Looking for extensions: {extensions}")
+    logger.info(f"Looking for extensions: {sorted(extensions)}")
     
-    # First pass: find all audio files from all directories
-    try:
-        for scan_dir in directories:
-            if _scan_stop_flag:
-                break
-            
-            if not os.path.exists(scan_dir):
-                logger.warning(f"Directory does not exist, skipping: {scan_dir}")
-                continue
+    # Files stream through three stages so inserts start as soon as the first
+    # directories are listed:
+    #   walker thread -> discovered -> metadata extraction -> extracted -> DB insert
+    loop = asyncio.get_running_loop()
+    discovered: asyncio.Queue = asyncio.Queue(maxsize=DISCOVERY_QUEUE_SIZE)
+    extracted: asyncio.Queue = asyncio.Queue(maxsize=METADATA_WINDOW)
+    # Set when the pipeline shuts down, for whatever reason, so the walker
+    # stops listing the rest of the tree
+    aborted = threading.Event()
+    
+    def on_files(files: List[Tuple[str, int]]):
+        """Hand a directory's audio files from the walker thread to the event loop"""
+        if not aborted.is_set():
+            asyncio.run_coroutine_threadsafe(discovered.put(files), loop).result()
+    
+    async def walk():
+        try:
+            await loop.run_in_executor(None, find_audio_files, directories, extensions, on_files, aborted)
+        except Exception as e:
+            logger.error(f"Error scanning directory: {e}")
+            _scan_status.errors.append(str(e))
+        finally:
+            await discovered.put(None)
+    
+    async def extract(existing_paths: set):
+        try:
+            while (files := await discovered.get()) is not None:
+                _scan_status.total += len(files)
+                _scan_status.files_found += len(files)
+                # Files already in the database are skipped without touching them
+                new_files = [item for item in files if item[0] not in existing_paths]
+                skipped = len(files) - len(new_files)
+                _scan_status.files_skipped += skipped
+                _scan_status.progress += skipped
                 
-            logger.info(f"Scanning: {scan_dir}")
-            for root, dirs, files in os.walk(scan_dir):
-                if _scan_stop_flag:
-                    break
-                    
-                for file in files:
-                    if any(file.lower().endswith(ext) for ext in extensions):
-                        audio_files.append(os.path.join(root, file))
+                # Files too small to meet the duration filter are dropped unopened
+                if min_seconds:
+                    long_enough = [item for item in new_files if not is_too_small_for_duration(item[1], min_seconds)]
+                    filtered = len(new_files) - len(long_enough)
+                    _scan_status.files_filtered += filtered
+                    _scan_status.progress += filtered
+                    new_files = long_enough
+                
+                # Send files to the worker processes in chunks to amortize IPC
+                for start in range(0, len(new_files), METADATA_CHUNK_SIZE):
+                    chunk = new_files[start:start + METADATA_CHUNK_SIZE]
+                    future = loop.run_in_executor(
+                        executor, extract_metadata_batch, [filepath for filepath, _ in chunk], min_seconds
+                    )
+                    await extracted.put((chunk, future))
+        finally:
+            await extracted.put(None)
+    
+    # One connection for the whole scan (rather than a session, which hands its
+    # connection back to the pool on every commit) so the cache PRAGMA covers
+    # every batch and is restored on the connection it was set on
+    async with engine.connect() as conn, _bulk_insert_cache(conn):
+        dialect = conn.dialect.name
         
-        _scan_status["total"] = len(audio_files)
-        _scan_status["files_found"] = len(audio_files)
-        logger.info(f"Found {len(audio_files)} audio files across {len(directories)} directories")
+        # Load known filepaths under the scanned directories once instead of
+        # querying for each file
+        existing_result = await conn.execute(
+            select(Track.filepath).where(
+                or_(*(Track.directory.startswith(scan_dir) for scan_dir in directories))
+            )
+        )
+        existing_paths = {row[0] for row in existing_result.fetchall()}
+        pending_rows: List[dict] = []
         
-    except Exception as e:
-        logger.error(f"Error scanning directory: {e}")
-        _scan_status["errors"].append(str(e))
-        _scan_status["running"] = False
-        return
-    
-    # Second pass: process files and add to database
-    async with get_db() as db:
-        for i, filepath in enumerate(audio_files):
-            if _scan_stop_flag:
-                logger.info("Scan stopped by user")
-                break
-            
-            _scan_status["progress"] = i + 1
-            _scan_status["current_file"] = os.path.basename(filepath)
+        # Read the duration filter once for the whole scan
+        min_duration = get_min_duration_setting()
+        min_seconds = min_duration * 60 if min_duration > 0 else 0
+        
+        async def flush_pending():
+            """Bulk insert the pending track rows and commit them
             
+            Each batch is its own transaction so the SQLite write lock is only
+            held for the insert itself, not across the extraction in between,
+            and concurrent match/tag writes aren't locked out of the database.
+            """
+            if not pending_rows:
+                return
             try:
-                # Check if already in database
-                existing = await db.execute(
-                    select(Track).where(Track.filepath == filepath)
-                )
-                if existing.scalar_one_or_none():
-                    _scan_status["files_skipped"] += 1
-                    continue
-                
-                # Extract metadata
-                metadata = extract_metadata_from_file(filepath)
-                filename_meta = parse_filename_for_metadata(os.path.basename(filepath))
-                
-                # Prefer file metadata, fall back to filename parsing
-                title = metadata["title"] or filename_meta["title"]
-                artist = metadata["artist"] or filename_meta["artist"]
-                
-                # Check minimum duration filter
-                min_duration = get_min_duration_setting()
-                if min_duration > 0 and metadata["duration"]:
-                    min_seconds = min_duration * 60
-                    if metadata["duration"] < min_seconds:
-                        _scan_status["files_filtered"] += 1
-                        logger.debug(f"Skipping {filepath}: duration {metadata['duration']}s < {min_seconds}s minimum")
-                        continue
-                
-                # Get file size
-                file_size = os.path.getsize(filepath)
+                # Core insert against the table: no ORM objects or unit of work
+                now = datetime.utcnow()
+                for row in pending_rows:
+                    row["created_at"] = now
+                    row["updated_at"] = now
+                # Rows that raced in since the prefetch are left alone by the
+                # unique filepath constraint instead of failing the batch
+                result = await conn.execute(_insert_new_tracks(dialect), pending_rows)
+                await conn.commit()
+                inserted = result.rowcount if result.rowcount >= 0 else len(pending_rows)
+                _scan_status.files_added += inserted
+                _scan_status.files_skipped += len(pending_rows) - inserted
+            except Exception as e:
+                await conn.rollback()
+                logger.error(f"Error inserting tracks, rolled back {len(pending_rows)} rows: {e}")
+                _scan_status.errors.append(f"Batch insert failed: {str(e)}")
+            pending_rows.clear()
+        
+        # Created only once setup is done, right before the try/finally that
+        # shuts it down. Spawn, not fork: forking copies the running event
+        # loop, DB pool and threads
+        executor = ProcessPoolExecutor(
+            max_workers=METADATA_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+        walk_task = asyncio.create_task(walk())
+        extract_task = asyncio.create_task(extract(existing_paths))
+        
+        try:
+            while (item := await extracted.get()) is not None:
+                if _scan_stop_flag:
+                    logger.info("Scan stopped by user")
+                    break
                 
-                # Create track record
-                track = Track(
-                    filepath=filepath,
-                    filename=os.path.basename(filepath),
-                    directory=os.path.dirname(filepath),
-                    title=title,
-                    artist=artist,
-                    album=metadata["album"],
-                    genre=metadata["genre"],
-                    year=metadata["year"],
-                    duration=metadata["duration"],
-                    file_size=file_size,
-                    file_format=metadata["file_format"],
-                    bitrate=metadata["bitrate"],
-                    sample_rate=metadata["sample_rate"],
-                    status="pending",
-                    series_tagged=metadata.get("series_tagged", False)  # Restore from file metadata
-                )
+                chunk, future = item
                 
-                db.add(track)
-                _scan_status["files_added"] += 1
+                # Progress is published once per chunk rather than per file
+                _scan_status.progress += len(chunk)
+                _scan_status.current_file = os.path.basename(chunk[-1][0])
                 
-                # Commit in batches of 100
-                if _scan_status["files_added"] % 100 == 0:
-                    await db.commit()
-                    logger.info(f"Processed {i + 1}/{len(audio_files)} files")
+                try:
+                    metadata_list = await future
+                except Exception as e:
+                    logger.error(f"Error extracting metadata for {len(chunk)} files: {e}")
+                    _scan_status.errors.append(f"Metadata extraction failed: {str(e)}")
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Error processing {filepath}: {e}")
-                _scan_status["errors"].append(f"{filepath}: {str(e)}")
+                for (filepath, file_size), metadata in zip(chunk, metadata_list):
+                    file_dir, filename = os.path.split(filepath)
+                    
+                    try:
+                        filename_meta = parse_filename_for_metadata(filename)
+                        
+                        # Prefer file metadata, fall back to filename parsing
+                        title = metadata["title"] or filename_meta["title"]
+                        artist = metadata["artist"] or filename_meta["artist"]
+                        
+                        # Check minimum duration filter
+                        if min_seconds and metadata["duration"] and metadata["duration"] < min_seconds:
+                            _scan_status.files_filtered += 1
+                            logger.debug(f"Skipping {filepath}: duration {metadata['duration']}s < {min_seconds}s minimum")
+                            continue
+                        
+                        # Queue track row for bulk insert
+                        pending_rows.append({
+                            "filepath": filepath,
+                            "filename": filename,
+                            "directory": file_dir,
+                            "title": title,
+                            "artist": artist,
+                            "album": metadata["album"],
+                            "genre": metadata["genre"],
+                            "year": metadata["year"],
+                            "duration": metadata["duration"],
+                            "file_size": file_size,
+                            "file_format": metadata["file_format"],
+                            "bitrate": metadata["bitrate"],
+                            "sample_rate": metadata["sample_rate"],
+                            "status": "pending",
+                            "series_tagged": metadata.get("series_tagged", False)  # Restore from file metadata
+                        })
+                        existing_paths.add(filepath)
+                        
+                        # Insert in batches
+                        if len(pending_rows) >= settings.scan_batch_size:
+                            await flush_pending()
+                            logger.info(f"Processed {_scan_status.progress}/{_scan_status.files_found} files")
+                        
+                    except Exception as e:
+                        logger.error(f"Error processing {filepath}: {e}")
+                        _scan_status.errors.append(f"{filepath}: {str(e)}")
+        finally:
+            # Stop the producers: the walker drops further listings, the
+            # extractor is cancelled, and anything still queued is discarded
+            aborted.set()
+            extract_task.cancel()
+            while not extracted.empty():
+                item = extracted.get_nowait()
+                if item is not None:
+                    item[1].cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+            while not walk_task.done():
+                while not discovered.empty():
+                    discovered.get_nowait()
+                await asyncio.sleep(0.05)
         
-        # Final commit
-        await db.commit()
+        # Insert remaining rows and commit
+        await flush_pending()
     
-    _scan_status["running"] = False
-    _scan_status["current_file"] = None
+    _scan_status.running = False
+    _scan_status.current_file = None
     
-    logger.info(f"Scan complete. Added: {_scan_status['files_added']}, Skipped: {_scan_status['files_skipped']}, Filtered: {_scan_status['files_filtered']}")
+    logger.info(f"Scan complete. Found: {_scan_status.files_found} across {len(directories)} directories, Added: {_scan_status.files_added}, Skipped: {_scan_status.files_skipped}, Filtered: {_scan_status.files_filtered}")
@@ -2,69 +2,404 @@
 Audio file tagger service - writes metadata and cover art to audio files
 """
 import os
-import shutil
+import re
 import asyncio
+import base64
+import hashlib
+import multiprocessing
+import threading
 import aiohttp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from io import BytesIO
 from typing import Optional, List, Tuple, Dict
 from datetime import datetime
 from pathlib import Path
 
 from mutagen import File as MutagenFile
-from mutagen.id3 import ID3, APIC, TIT2, TPE1, TALB, TCON, TDRC, ID3NoHeaderError
+from mutagen.id3 import ID3, APIC, TIT1, TIT2, TPE1, TPE2, TALB, TCON, TDRC, ID3NoHeaderError
 from mutagen.mp3 import MP3
 from mutagen.flac import FLAC, Picture
-from mutagen.mp4 import MP4, MP4Cover
+from mutagen.mp4 import MP4, MP4Cover, MP4Tags
 from mutagen.oggvorbis import OggVorbis
 
 from PIL import Image
-from sqlalchemy import select
+from cachetools import LRUCache
+from sqlalchemy import select, update
 
 from backend.services.database import get_db
 from backend.models.track import Track, TagPreview
 from backend.config import settings
 from loguru import logger
 
+# Extensions the tagger can write; anything else is rejected before any file or network work
+_MP4_EXTENSIONS = frozenset({'.m4a', '.aac', '.mp4'})
+SUPPORTED_TAG_EXTENSIONS = frozenset({'.mp3', '.flac', '.ogg'}) | _MP4_EXTENSIONS
+
+# Rows per bulk UPDATE when recording batch tag/rename results
+BULK_UPDATE_CHUNK = 500
+
+# Largest cover art download accepted
+MAX_COVER_BYTES = 4 * 1024 * 1024
+
+# Resized covers kept in memory (~100 KB each)
+COVER_CACHE_SIZE = 64
+
+# JPEG covers at or under this size (and within max_size) are embedded without re-encoding
+PASSTHROUGH_COVER_BYTES = 100 * 1024
+
+# Downloaded covers at or above this size are resized in a worker process;
+# smaller ones are cheaper to resize inline than to pickle across
+RESIZE_IN_PROCESS_BYTES = 128 * 1024
+
+# Buffer mutagen uses when it has to shift audio data to grow a tag block.
+# The 256 KiB default means many small round-trips on network shares.
+MUTAGEN_BUFFER_SIZE = 1 << 20
+
+
+def _set_mutagen_buffer_size(size: int):
+    """Raise mutagen's file rewrite buffer (private API, skipped if it changes)"""
+    try:
+        import mutagen._util as mutagen_util
+        
+        old_size = mutagen_util._DEFAULT_BUFFER_SIZE
+        if old_size >= size:
+            return
+        mutagen_util._DEFAULT_BUFFER_SIZE = size
+        
+        # The helpers bind the default at definition time, so patch those too
+        for name in ("move_bytes", "resize_file", "insert_bytes", "delete_bytes"):
+            func = getattr(mutagen_util, name, None)
+            if func is not None and func.__defaults__:
+                func.__defaults__ = tuple(
+                    size if default == old_size else default for default in func.__defaults__
+                )
+    except Exception as e:
+        logger.debug(f"Could not raise mutagen buffer size: {e}")
+
+
+_set_mutagen_buffer_size(MUTAGEN_BUFFER_SIZE)
+
+
+def _keep_padding(info) -> int:
+    """Reuse existing tag padding whenever the new tags fit, so no rewrite is needed"""
+    if info.padding >= 0:
+        return info.padding
+    return info.get_default_padding()
+
+
+# Tag keys read by get_current_tags for each tag container; Vorbis comments
+# (FLAC/OGG) and anything unrecognised use the lowercase Vorbis names
+_ID3_TAG_KEYS = {"title": "TIT2", "artist": "TPE1", "album": "TALB", "genre": "TCON", "year": "TDRC"}
+_MP4_TAG_KEYS = {"title": "\xa9nam", "artist": "\xa9ART", "album": "\xa9alb", "genre": "\xa9gen", "year": "\xa9day"}
+_VORBIS_TAG_KEYS = {"title": "title", "artist": "artist", "album": "album", "genre": "genre", "year": "date"}
+
+
+def _first_text(value) -> Optional[str]:
+    """First text value of an ID3 frame or Vorbis/MP4 value list"""
+    if value is None:
+        return None
+    # ID3 frames keep their values in .text
+    value = getattr(value, 'text', value)
+    if isinstance(value, str):
+        return value
+    return str(value[0]) if value else None
+
+
+# JPEG start-of-frame markers (baseline, progressive, lossless, arithmetic)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _image_dimensions(data: bytes) -> Tuple[int, int]:
+    """Read (width, height) from JPEG/PNG headers without decoding
+    
+    Returns (0, 0) for anything else, which FLAC picture blocks treat as unknown.
+    """
+    if data[:8] == _PNG_SIGNATURE and data[12:16] == b'IHDR':
+        return int.from_bytes(data[16:20], 'big'), int.from_bytes(data[20:24], 'big')
+    
+    if data[:2] == b'\xff\xd8':
+        i = 2
+        while i + 9 <= len(data):
+            if data[i] != 0xFF:
+                break
+            marker = data[i + 1]
+            if marker == 0xFF:
+                # Fill byte before the marker
+                i += 1
+                continue
+            if 0xD0 <= marker <= 0xD9 or marker == 0x01:
+                # Standalone markers carry no length
+                i += 2
+                continue
+            if marker in _JPEG_SOF_MARKERS:
+                height = int.from_bytes(data[i + 5:i + 7], 'big')
+                width = int.from_bytes(data[i + 7:i + 9], 'big')
+                return width, height
+            i += 2 + int.from_bytes(data[i + 2:i + 4], 'big')
+    
+    return 0, 0
+
+
+def _set_tag(audio, key: str, value, frame_cls=None) -> bool:
+    """Set a text tag unless it already holds value; returns True if the tags changed
+    
+    ID3 tags pass the frame class to build, Vorbis/MP4 tags store a one-item list.
+    """
+    if not value:
+        return False
+    value = str(value)
+    
+    current = audio.get(key)
+    if current is not None:
+        # ID3 frames keep their values in .text
+        current = getattr(current, 'text', current)
+        if [str(v) for v in current] == [value]:
+            return False
+    
+    audio[key] = frame_cls(encoding=3, text=value) if frame_cls else [value]
+    return True
+
+
+def resize_cover_art_worker(image_data: bytes, max_size: int = 800) -> bytes:
+    """Resize cover art to reasonable size (module level so it can run in a process pool)"""
+    try:
+        img = Image.open(BytesIO(image_data))
+        
+        # Small JPEGs are already fine to embed as-is
+        if (img.format == 'JPEG' and img.mode in ('RGB', 'L')
+                and max(img.size) <= max_size and len(image_data) <= PASSTHROUGH_COVER_BYTES):
+            return image_data
+        
+        # Let libjpeg scale down by 1/2, 1/4 or 1/8 while decoding (no-op for other formats)
+        img.draft('RGB', (max_size, max_size))
+        
+        # Convert to RGB if necessary (for JPEG)
+        if img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        
+        # Box-reduce by an integer factor first so the final filter runs on a
+        # much smaller image; floor division keeps the result >= max_size
+        scale = max(img.size) // max_size
+        if scale >= 2:
+            img = img.reduce(scale)
+        
+        # Resize if larger than max_size
+        if max(img.size) > max_size:
+            img.thumbnail((max_size, max_size), Image.Resampling.BICUBIC)
+        
+        # Save to bytes
+        output = BytesIO()
+        img.save(output, format='JPEG', quality=85, optimize=True, progressive=True)
+        return output.getvalue()
+        
+    except Exception as e:
+        logger.error(f"Error resizing cover art: {e}")
+        return image_data
+
+
+def _build_apic(cover_data: bytes) -> APIC:
+    """ID3 front cover frame"""
+    return APIC(
+        encoding=3,
+        mime='image/jpeg',
+        type=3,  # Cover (front)
+        desc='Cover',
+        data=cover_data
+    )
+
+
+def _build_flac_picture(cover_data: bytes) -> Picture:
+    """FLAC front cover picture block"""
+    picture = Picture()
+    picture.type = 3  # Cover (front)
+    picture.mime = 'image/jpeg'
+    picture.desc = 'Cover'
+    picture.data = cover_data
+    # Get image dimensions
+    picture.width, picture.height = _image_dimensions(cover_data)
+    picture.depth = 24
+    return picture
+
+
+def _build_mp4_cover(cover_data: bytes) -> MP4Cover:
+    """MP4 covr atom value"""
+    return MP4Cover(cover_data, imageformat=MP4Cover.FORMAT_JPEG)
+
+
+def _build_ogg_picture(cover_data: bytes) -> str:
+    """OGG cover art: a FLAC picture block base64 encoded into METADATA_BLOCK_PICTURE"""
+    return base64.b64encode(_build_flac_picture(cover_data).write()).decode('ascii')
+
+
+_COVER_BUILDERS = {
+    'apic': _build_apic,
+    'flac': _build_flac_picture,
+    'mp4': _build_mp4_cover,
+    'ogg': _build_ogg_picture,
+}
+
 
 class AudioTagger:
     """Service for writing metadata to audio files"""
     
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._resize_pool: Optional[ProcessPoolExecutor] = None
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        # Resized cover art by URL, so album batches fetch and resize each cover once
+        self._cover_cache: LRUCache = LRUCache(maxsize=COVER_CACHE_SIZE)
+        self._cover_locks: Dict[str, asyncio.Lock] = {}
+        # Callers holding or waiting on each cover lock; the lock is dropped at zero
+        self._cover_lock_users: Dict[str, int] = {}
+        # Built cover frames/blocks per (cover digest, format); written from worker threads
+        self._cover_blocks: LRUCache = LRUCache(maxsize=COVER_CACHE_SIZE * 4)
+        self._cover_blocks_lock = threading.Lock()
+        # Format-specific tag writers used by tag_file, keyed by lowercase extension
+        self._taggers = {
+            '.mp3': self.tag_mp3,
+            '.flac': self.tag_flac,
+            '.m4a': self.tag_m4a,
+            '.aac': self.tag_m4a,
+            '.mp4': self.tag_m4a,
+            '.ogg': self.tag_ogg,
+        }
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared HTTP session used for cover downloads"""
+        if self._session is None or self._session.closed:
+            # Keep-alive pool so repeated covers from the same CDN skip TCP/TLS setup
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+        return self._session
+    
+    def _cover_block(self, cover_data: bytes, kind: str):
+        """Get the embeddable cover object of the given kind, built once per distinct cover
+        
+        Series batches write the same cover to every file, so the APIC frame, FLAC
+        Picture and serialized OGG block are shared instead of rebuilt per track.
+        """
+        key = (hashlib.blake2b(cover_data, digest_size=16).digest(), kind)
+        with self._cover_blocks_lock:
+            block = self._cover_blocks.get(key)
+        if block is None:
+            block = _COVER_BUILDERS[kind](cover_data)
+            with self._cover_blocks_lock:
+                self._cover_blocks[key] = block
+        return block
+    
+    def _get_resize_pool(self) -> ProcessPoolExecutor:
+        """Get or create the process pool used to resize large covers"""
+        if self._resize_pool is None:
+            # Spawn, not fork: the parent has a live event loop and thread pools
+            self._resize_pool = ProcessPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1), mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._resize_pool
+    
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """Get or create the thread pool used for mutagen reads and writes
+        
+        Kept separate from the loop's default executor so tagging doesn't compete
+        with other services' blocking work for threads.
+        """
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='tagger-io')
+        return self._io_pool
+    
+    async def aclose(self):
+        """Close the shared HTTP session and the worker pools"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
+        if self._resize_pool is not None:
+            self._resize_pool.shutdown(wait=False, cancel_futures=True)
+            self._resize_pool = None
+        
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False)
+            self._io_pool = None
+    
     async def download_cover_art(self, url: str) -> Optional[bytes]:
         """Download cover art from URL"""
         if not url:
             return None
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        return await response.read()
+            session = await self._get_session()
+            async with session.get(url) as response:
+                if response.status != 200:
+                    return None
+                
+                # Reject error pages served with a 200 before reading the body
+                if response.content_type and not response.content_type.startswith('image/') \
+                        and response.content_type != 'application/octet-stream':
+                    logger.warning(f"Cover art URL returned {response.content_type}, not an image: {url}")
+                    return None
+                
+                if response.content_length and response.content_length > MAX_COVER_BYTES:
+                    logger.warning(f"Cover art too large ({response.content_length} bytes): {url}")
+                    return None
+                
+                # Stream with a cap in case Content-Length is missing or wrong
+                data = bytearray()
+                async for chunk in response.content.iter_chunked(65536):
+                    data.extend(chunk)
+                    if len(data) > MAX_COVER_BYTES:
+                        logger.warning(f"Cover art exceeded {MAX_COVER_BYTES} bytes: {url}")
+                        return None
+                return bytes(data)
         except Exception as e:
             logger.error(f"Error downloading cover art: {e}")
         
         return None
     
+    async def get_cover_art(self, url: str) -> Optional[bytes]:
+        """Download and resize cover art, reusing the result for repeated URLs"""
+        if not url:
+            return None
+        
+        cover_data = self._cover_cache.get(url)
+        if cover_data is not None:
+            return cover_data
+        
+        # Coalesce concurrent requests for the same cover into one download
+        lock = self._cover_locks.setdefault(url, asyncio.Lock())
+        self._cover_lock_users[url] = self._cover_lock_users.get(url, 0) + 1
+        try:
+            async with lock:
+                cover_data = self._cover_cache.get(url)
+                if cover_data is not None:
+                    return cover_data
+                
+                cover_data = await self.download_cover_art(url)
+                if cover_data:
+                    if len(cover_data) >= RESIZE_IN_PROCESS_BYTES:
+                        # Decode/resample holds the GIL, so big covers go to worker processes
+                        loop = asyncio.get_running_loop()
+                        cover_data = await loop.run_in_executor(
+                            self._get_resize_pool(), resize_cover_art_worker, cover_data, 800
+                        )
+                    else:
+                        cover_data = self.resize_cover_art(cover_data)
+                    self._cover_cache[url] = cover_data
+                return cover_data
+        finally:
+            # Not lock.locked(): a waiter that is queued but not yet holding
+            # the lock would lose it to a fresh lock and a second download
+            users = self._cover_lock_users[url] - 1
+            if users:
+                self._cover_lock_users[url] = users
+            else:
+                del self._cover_lock_users[url]
+                del self._cover_locks[url]
+    
     def resize_cover_art(self, image_data: bytes, max_size: int = 800) -> bytes:
         """Resize cover art to reasonable size"""
-        try:
-            img = Image.open(BytesIO(image_data))
-            
-            # Convert to RGB if necessary (for JPEG)
-            if img.mode in ('RGBA', 'P'):
-                img = img.convert('RGB')
-            
-            # Resize if larger than max_size
-            if max(img.size) > max_size:
-                img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-            
-            # Save to bytes
-            output = BytesIO()
-            img.save(output, format='JPEG', quality=90)
-            return output.getvalue()
-            
-        except Exception as e:
-            logger.error(f"Error resizing cover art: {e}")
-            return image_data
+        return resize_cover_art_worker(image_data, max_size)
     
     async def write_album_artist(
         self,
@@ -75,12 +410,15 @@ class AudioTagger:
         album_artist: Optional[str] = None
     ) -> bool:
         """Write album, artist, genre, and album artist tags to a file (quick update for series)"""
+        ext = os.path.splitext(filepath)[1].lower()
+        if ext not in SUPPORTED_TAG_EXTENSIONS:
+            logger.warning(f"Unsupported format for quick tag update: {ext}")
+            return False
+        
         if not os.path.exists(filepath):
             logger.error(f"File not found: {filepath}")
             return False
         
-        ext = os.path.splitext(filepath)[1].lower()
-        
         # Marker to indicate this track was series-tagged
         series_marker = "SetList Series"
         
@@ -91,75 +429,68 @@ class AudioTagger:
                 except ID3NoHeaderError:
                     audio = ID3()
                 
-                if album:
-                    audio['TALB'] = TALB(encoding=3, text=album)
-                if artist:
-                    audio['TPE1'] = TPE1(encoding=3, text=artist)
-                if genre:
-                    from mutagen.id3 import TCON
-                    audio['TCON'] = TCON(encoding=3, text=genre)
-                if album_artist:
-                    from mutagen.id3 import TPE2
-                    audio['TPE2'] = TPE2(encoding=3, text=album_artist)
+                changed = False
+                changed |= _set_tag(audio, 'TALB', album, TALB)
+                changed |= _set_tag(audio, 'TPE1', artist, TPE1)
+                changed |= _set_tag(audio, 'TCON', genre, TCON)
+                changed |= _set_tag(audio, 'TPE2', album_artist, TPE2)
                 # Add series marker to grouping tag (TIT1)
-                from mutagen.id3 import TIT1
-                audio['TIT1'] = TIT1(encoding=3, text=series_marker)
+                changed |= _set_tag(audio, 'TIT1', series_marker, TIT1)
+                
+                if not changed:
+                    return True
                 
-                audio.save(filepath)
+                audio.save(filepath, padding=_keep_padding)
                 logger.info(f"Updated album/artist/genre/album_artist tags for: {filepath}")
                 return True
                 
             elif ext == '.flac':
                 audio = FLAC(filepath)
-                if album:
-                    audio['ALBUM'] = album
-                if artist:
-                    audio['ARTIST'] = artist
-                if genre:
-                    audio['GENRE'] = genre
-                if album_artist:
-                    audio['ALBUMARTIST'] = album_artist
+                changed = False
+                changed |= _set_tag(audio, 'ALBUM', album)
+                changed |= _set_tag(audio, 'ARTIST', artist)
+                changed |= _set_tag(audio, 'GENRE', genre)
+                changed |= _set_tag(audio, 'ALBUMARTIST', album_artist)
                 # Add series marker to grouping tag
-                audio['GROUPING'] = series_marker
-                audio.save()
+                changed |= _set_tag(audio, 'GROUPING', series_marker)
+                if not changed:
+                    return True
+                
+                audio.save(padding=_keep_padding)
                 logger.info(f"Updated album/artist/genre/album_artist tags for: {filepath}")
                 return True
                 
-            elif ext in ['.m4a', '.aac', '.mp4']:
+            elif ext in _MP4_EXTENSIONS:
                 audio = MP4(filepath)
-                if album:
-                    audio['\xa9alb'] = [album]
-                if artist:
-                    audio['\xa9ART'] = [artist]
-                if genre:
-                    audio['\xa9gen'] = [genre]
-                if album_artist:
-                    audio['aART'] = [album_artist]
+                changed = False
+                changed |= _set_tag(audio, '\xa9alb', album)
+                changed |= _set_tag(audio, '\xa9ART', artist)
+                changed |= _set_tag(audio, '\xa9gen', genre)
+                changed |= _set_tag(audio, 'aART', album_artist)
                 # Add series marker to grouping tag
-                audio['\xa9grp'] = [series_marker]
-                audio.save()
+                changed |= _set_tag(audio, '\xa9grp', series_marker)
+                if not changed:
+                    return True
+                
+                audio.save(padding=_keep_padding)
                 logger.info(f"Updated album/artist/genre/album_artist tags for: {filepath}")
                 return True
                 
             elif ext == '.ogg':
                 audio = OggVorbis(filepath)
-                if album:
-                    audio['ALBUM'] = [album]
-                if artist:
-                    audio['ARTIST'] = [artist]
-                if genre:
-                    audio['GENRE'] = [genre]
-                if album_artist:
-                    audio['ALBUMARTIST'] = [album_artist]
+                changed = False
+                changed |= _set_tag(audio, 'ALBUM', album)
+                changed |= _set_tag(audio, 'ARTIST', artist)
+                changed |= _set_tag(audio, 'GENRE', genre)
+                changed |= _set_tag(audio, 'ALBUMARTIST', album_artist)
                 # Add series marker to grouping tag
-                audio['GROUPING'] = [series_marker]
-                audio.save()
+                changed |= _set_tag(audio, 'GROUPING', series_marker)
+                if not changed:
+                    return True
+                
+                audio.save(padding=_keep_padding)
                 logger.info(f"Updated album/artist/genre/album_artist tags for: {filepath}")
                 return True
-            
-            else:
-                logger.warning(f"Unsupported format for quick tag update: {ext}")
-                return False
                 
         except Exception as e:
             logger.error(f"Error writing album/artist/genre/album_artist to {filepath}: {e}")
@@ -175,12 +506,15 @@ class AudioTagger:
         cover_data: Optional[bytes] = None
     ) -> bool:
         """Synchronous version - Write album, artist, genre, album artist, and cover art tags to a file"""
+        ext = os.path.splitext(filepath)[1].lower()
+        if ext not in SUPPORTED_TAG_EXTENSIONS:
+            logger.warning(f"Unsupported format for tag update with cover: {ext}")
+            return False
+        
         if not os.path.exists(filepath):
             logger.error(f"File not found: {filepath}")
             return False
         
-        ext = os.path.splitext(filepath)[1].lower()
-        
         try:
             if ext == '.mp3':
                 try:
@@ -188,114 +522,82 @@ class AudioTagger:
                 except ID3NoHeaderError:
                     audio = ID3()
                 
-                if album:
-                    audio['TALB'] = TALB(encoding=3, text=album)
-                if artist:
-                    audio['TPE1'] = TPE1(encoding=3, text=artist)
-                if genre:
-                    from mutagen.id3 import TCON
-                    audio['TCON'] = TCON(encoding=3, text=genre)
-                if album_artist:
-                    from mutagen.id3 import TPE2
-                    audio['TPE2'] = TPE2(encoding=3, text=album_artist)
+                changed = False
+                changed |= _set_tag(audio, 'TALB', album, TALB)
+                changed |= _set_tag(audio, 'TPE1', artist, TPE1)
+                changed |= _set_tag(audio, 'TCON', genre, TCON)
+                changed |= _set_tag(audio, 'TPE2', album_artist, TPE2)
                 
                 # Set cover art
-                if cover_data:
-                    audio['APIC'] = APIC(
-                        encoding=3,
-                        mime='image/jpeg',
-                        type=3,  # Cover (front)
-                        desc='Cover',
-                        data=cover_data
-                    )
-                
-                audio.save(filepath)
+                if cover_data and not any(frame.data == cover_data for frame in audio.getall('APIC')):
+                    changed = True
+                    audio['APIC'] = self._cover_block(cover_data, 'apic')
+                
+                if not changed:
+                    return True
+                
+                audio.save(filepath, padding=_keep_padding)
                 return True
                 
             elif ext == '.flac':
                 audio = FLAC(filepath)
-                if album:
-                    audio['ALBUM'] = album
-                if artist:
-                    audio['ARTIST'] = artist
-                if genre:
-                    audio['GENRE'] = genre
-                if album_artist:
-                    audio['ALBUMARTIST'] = album_artist
+                changed = False
+                changed |= _set_tag(audio, 'ALBUM', album)
+                changed |= _set_tag(audio, 'ARTIST', artist)
+                changed |= _set_tag(audio, 'GENRE', genre)
+                changed |= _set_tag(audio, 'ALBUMARTIST', album_artist)
                 
                 # Set cover art
-                if cover_data:
-                    from mutagen.flac import Picture
-                    picture = Picture()
-                    picture.type = 3  # Cover (front)
-                    picture.mime = 'image/jpeg'
-                    picture.desc = 'Cover'
-                    picture.data = cover_data
-                    # Get image dimensions
-                    from PIL import Image
-                    from io import BytesIO
-                    img = Image.open(BytesIO(cover_data))
-                    picture.width = img.width
-                    picture.height = img.height
-                    picture.depth = 24
+                if cover_data and not any(pic.data == cover_data for pic in audio.pictures):
+                    changed = True
                     audio.clear_pictures()
-                    audio.add_picture(picture)
+                    audio.add_picture(self._cover_block(cover_data, 'flac'))
+                
+                if not changed:
+                    return True
                 
-                audio.save()
+                audio.save(padding=_keep_padding)
                 return True
                 
-            elif ext in ['.m4a', '.aac', '.mp4']:
+            elif ext in _MP4_EXTENSIONS:
                 audio = MP4(filepath)
-                if album:
-                    audio['\xa9alb'] = [album]
-                if artist:
-                    audio['\xa9ART'] = [artist]
-                if genre:
-                    audio['\xa9gen'] = [genre]
-                if album_artist:
-                    audio['aART'] = [album_artist]
+                changed = False
+                changed |= _set_tag(audio, '\xa9alb', album)
+                changed |= _set_tag(audio, '\xa9ART', artist)
+                changed |= _set_tag(audio, '\xa9gen', genre)
+                changed |= _set_tag(audio, 'aART', album_artist)
                 
                 # Set cover art
-                if cover_data:
-                    audio['covr'] = [MP4Cover(cover_data, imageformat=MP4Cover.FORMAT_JPEG)]
+                if cover_data and not any(bytes(cover) == cover_data for cover in audio.get('covr', [])):
+                    changed = True
+                    audio['covr'] = [self._cover_block(cover_data, 'mp4')]
+                
+                if not changed:
+                    return True
                 
-                audio.save()
+                audio.save(padding=_keep_padding)
                 return True
                 
             elif ext == '.ogg':
                 audio = OggVorbis(filepath)
-                if album:
-                    audio['ALBUM'] = [album]
-                if artist:
-                    audio['ARTIST'] = [artist]
-                if genre:
-                    audio['GENRE'] = [genre]
-                if album_artist:
-                    audio['ALBUMARTIST'] = [album_artist]
+                changed = False
+                changed |= _set_tag(audio, 'ALBUM', album)
+                changed |= _set_tag(audio, 'ARTIST', artist)
+                changed |= _set_tag(audio, 'GENRE', genre)
+                changed |= _set_tag(audio, 'ALBUMARTIST', album_artist)
                 
                 # OGG cover art requires base64 encoding in METADATA_BLOCK_PICTURE
                 if cover_data:
-                    import base64
-                    from mutagen.flac import Picture
-                    picture = Picture()
-                    picture.type = 3
-                    picture.mime = 'image/jpeg'
-                    picture.desc = 'Cover'
-                    picture.data = cover_data
-                    from PIL import Image
-                    from io import BytesIO
-                    img = Image.open(BytesIO(cover_data))
-                    picture.width = img.width
-                    picture.height = img.height
-                    picture.depth = 24
-                    audio['metadata_block_picture'] = [base64.b64encode(picture.write()).decode('ascii')]
-                
-                audio.save()
+                    picture_b64 = self._cover_block(cover_data, 'ogg')
+                    if audio.get('metadata_block_picture') != [picture_b64]:
+                        changed = True
+                        audio['metadata_block_picture'] = [picture_b64]
+                
+                if not changed:
+                    return True
+                
+                audio.save(padding=_keep_padding)
                 return True
-            
-            else:
-                logger.warning(f"Unsupported format for tag update with cover: {ext}")
-                return False
                 
         except Exception as e:
             logger.error(f"Error writing tags with cover to {filepath}: {e}")
@@ -311,9 +613,9 @@ class AudioTagger:
         cover_data: Optional[bytes] = None
     ) -> bool:
         """Async wrapper - runs file I/O in thread pool to not block event loop"""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None,  # Uses default thread pool
+            self._get_io_pool(),
             self._write_album_artist_cover_sync,
             filepath, album, artist, genre, album_artist, cover_data
         )
@@ -336,29 +638,23 @@ class AudioTagger:
             except ID3NoHeaderError:
                 audio = ID3()
             
+            changed = False
             # Set tags
-            if title:
-                audio['TIT2'] = TIT2(encoding=3, text=title)
-            if artist:
-                audio['TPE1'] = TPE1(encoding=3, text=artist)
-            if album:
-                audio['TALB'] = TALB(encoding=3, text=album)
-            if genre:
-                audio['TCON'] = TCON(encoding=3, text=genre)
-            if year:
-                audio['TDRC'] = TDRC(encoding=3, text=str(year))
+            changed |= _set_tag(audio, 'TIT2', title, TIT2)
+            changed |= _set_tag(audio, 'TPE1', artist, TPE1)
+            changed |= _set_tag(audio, 'TALB', album, TALB)
+            changed |= _set_tag(audio, 'TCON', genre, TCON)
+            changed |= _set_tag(audio, 'TDRC', year, TDRC)
             
             # Set cover art
-            if cover_data:
-                audio['APIC'] = APIC(
-                    encoding=3,
-                    mime='image/jpeg',
-                    type=3,  # Cover (front)
-                    desc='Cover',
-                    data=cover_data
-                )
+            if cover_data and not any(frame.data == cover_data for frame in audio.getall('APIC')):
+                changed = True
+                audio['APIC'] = self._cover_block(cover_data, 'apic')
             
-            audio.save(filepath)
+            if not changed:
+                return True
+            
+            audio.save(filepath, padding=_keep_padding)
             return True
             
         except Exception as e:
@@ -379,37 +675,25 @@ class AudioTagger:
         try:
             audio = FLAC(filepath)
             
+            changed = False
             # Set tags
-            if title:
-                audio['TITLE'] = title
-            if artist:
-                audio['ARTIST'] = artist
-            if album:
-                audio['ALBUM'] = album
-            if genre:
-                audio['GENRE'] = genre
-            if year:
-                audio['DATE'] = str(year)
+            changed |= _set_tag(audio, 'TITLE', title)
+            changed |= _set_tag(audio, 'ARTIST', artist)
+            changed |= _set_tag(audio, 'ALBUM', album)
+            changed |= _set_tag(audio, 'GENRE', genre)
+            changed |= _set_tag(audio, 'DATE', year)
             
             # Set cover art
-            if cover_data:
-                picture = Picture()
-                picture.type = 3  # Cover (front)
-                picture.mime = 'image/jpeg'
-                picture.desc = 'Cover'
-                picture.data = cover_data
-                
-                # Get image dimensions
-                img = Image.open(BytesIO(cover_data))
-                picture.width = img.width
-                picture.height = img.height
-                picture.depth = 24
-                
+            if cover_data and not any(pic.data == cover_data for pic in audio.pictures):
+                changed = True
                 # Clear existing pictures and add new one
                 audio.clear_pictures()
-                audio.add_picture(picture)
+                audio.add_picture(self._cover_block(cover_data, 'flac'))
+            
+            if not changed:
+                return True
             
-            audio.save()
+            audio.save(padding=_keep_padding)
             return True
             
         except Exception as e:
@@ -430,23 +714,23 @@ class AudioTagger:
         try:
             audio = MP4(filepath)
             
+            changed = False
             # Set tags using iTunes tags
-            if title:
-                audio['\xa9nam'] = [title]
-            if artist:
-                audio['\xa9ART'] = [artist]
-            if album:
-                audio['\xa9alb'] = [album]
-            if genre:
-                audio['\xa9gen'] = [genre]
-            if year:
-                audio['\xa9day'] = [str(year)]
+            changed |= _set_tag(audio, '\xa9nam', title)
+            changed |= _set_tag(audio, '\xa9ART', artist)
+            changed |= _set_tag(audio, '\xa9alb', album)
+            changed |= _set_tag(audio, '\xa9gen', genre)
+            changed |= _set_tag(audio, '\xa9day', year)
             
             # Set cover art
-            if cover_data:
-                audio['covr'] = [MP4Cover(cover_data, imageformat=MP4Cover.FORMAT_JPEG)]
+            if cover_data and not any(bytes(cover) == cover_data for cover in audio.get('covr', [])):
+                changed = True
+                audio['covr'] = [self._cover_block(cover_data, 'mp4')]
+            
+            if not changed:
+                return True
             
-            audio.save()
+            audio.save(padding=_keep_padding)
             return True
             
         except Exception as e:
@@ -467,22 +751,21 @@ class AudioTagger:
         try:
             audio = OggVorbis(filepath)
             
+            changed = False
             # Set tags
-            if title:
-                audio['TITLE'] = title
-            if artist:
-                audio['ARTIST'] = artist
-            if album:
-                audio['ALBUM'] = album
-            if genre:
-                audio['GENRE'] = genre
-            if year:
-                audio['DATE'] = str(year)
+            changed |= _set_tag(audio, 'TITLE', title)
+            changed |= _set_tag(audio, 'ARTIST', artist)
+            changed |= _set_tag(audio, 'ALBUM', album)
+            changed |= _set_tag(audio, 'GENRE', genre)
+            changed |= _set_tag(audio, 'DATE', year)
             
             # Note: OGG cover art is more complex, skipping for now
             # Would need to embed as METADATA_BLOCK_PICTURE
             
-            audio.save()
+            if not changed:
+                return True
+            
+            audio.save(padding=_keep_padding)
             return True
             
         except Exception as e:
@@ -500,27 +783,42 @@ class AudioTagger:
         cover_url: Optional[str] = None
     ) -> bool:
         """Tag an audio file based on its format"""
-        ext = Path(filepath).suffix.lower()
+        ext = os.path.splitext(filepath)[1].lower()
         
-        # Download cover art if provided
-        cover_data = None
-        if cover_url:
-            cover_data = await self.download_cover_art(cover_url)
-            if cover_data:
-                cover_data = self.resize_cover_art(cover_data)
-        
-        # Tag based on format
-        if ext == '.mp3':
-            return self.tag_mp3(filepath, title, artist, album, genre, year, cover_data)
-        elif ext == '.flac':
-            return self.tag_flac(filepath, title, artist, album, genre, year, cover_data)
-        elif ext in ['.m4a', '.aac', '.mp4']:
-            return self.tag_m4a(filepath, title, artist, album, genre, year, cover_data)
-        elif ext == '.ogg':
-            return self.tag_ogg(filepath, title, artist, album, genre, year, cover_data)
-        else:
+        tagger = self._taggers.get(ext)
+        if tagger is None:
             logger.warning(f"Unsupported format for tagging: {ext}")
             return False
+        
+        # Files that already carry these tags skip the write. Only without a
+        # cover: an existing embedded cover may differ from cover_url, and
+        # replacing it is part of tagging.
+        loop = asyncio.get_running_loop()
+        if not cover_url:
+            new_tags = {
+                "title": title,
+                "artist": artist,
+                "album": album,
+                "genre": genre,
+                "year": year,
+                "has_cover": False
+            }
+            if not await loop.run_in_executor(self._get_io_pool(), self.needs_update, filepath, new_tags):
+                logger.debug(f"Tags already up to date: {filepath}")
+                return True
+        
+        # Download cover art if provided
+        cover_data = await self.get_cover_art(cover_url) if cover_url else None
+        
+        # Tag based on format (file I/O runs off the event loop)
+        return await loop.run_in_executor(
+            self._get_io_pool(), tagger,
+            filepath, title, artist, album, genre, year, cover_data
+        )
+    
+    def needs_update(self, filepath: str, new_tags: Dict) -> bool:
+        """Check whether writing new_tags would change anything in the file"""
+        return bool(diff_tags(self.get_current_tags(filepath), new_tags))
     
     def get_current_tags(self, filepath: str) -> Dict:
         """Get current tags from a file"""
@@ -534,24 +832,28 @@ class AudioTagger:
         }
         
         try:
-            audio = MutagenFile(filepath, easy=True)
-            if audio:
-                tags["title"] = audio.get("title", [None])[0]
-                tags["artist"] = audio.get("artist", [None])[0]
-                tags["album"] = audio.get("album", [None])[0]
-                tags["genre"] = audio.get("genre", [None])[0]
-                tags["year"] = audio.get("date", [None])[0] or audio.get("year", [None])[0]
-            
-            # Check for cover art (non-easy mode)
-            audio_full = MutagenFile(filepath)
-            if audio_full:
-                if hasattr(audio_full, 'pictures') and audio_full.pictures:
+            # One full (non-easy) open covers both the text fields and the cover check
+            audio = MutagenFile(filepath)
+            if audio and audio.tags is not None:
+                audio_tags = audio.tags
+                if isinstance(audio_tags, ID3):
+                    tag_keys = _ID3_TAG_KEYS
+                elif isinstance(audio_tags, MP4Tags):
+                    tag_keys = _MP4_TAG_KEYS
+                else:
+                    tag_keys = _VORBIS_TAG_KEYS
+                
+                for field, key in tag_keys.items():
+                    tags[field] = _first_text(audio_tags.get(key))
+                if not tags["year"] and tag_keys is _VORBIS_TAG_KEYS:
+                    tags["year"] = _first_text(audio_tags.get("year"))
+                
+                if getattr(audio, 'pictures', None):
                     tags["has_cover"] = True
-                elif hasattr(audio_full, 'tags'):
-                    if 'APIC:' in str(audio_full.tags) or 'APIC:Cover' in str(audio_full.tags):
-                        tags["has_cover"] = True
-                    if 'covr' in audio_full.tags:
-                        tags["has_cover"] = True
+                elif isinstance(audio_tags, ID3):
+                    tags["has_cover"] = bool(audio_tags.getall('APIC'))
+                else:
+                    tags["has_cover"] = 'covr' in audio_tags or 'metadata_block_picture' in audio_tags
                         
         except Exception as e:
             logger.error(f"Error reading tags from {filepath}: {e}")
@@ -559,6 +861,32 @@ class AudioTagger:
         return tags
 
 
+def diff_tags(current_tags: Dict, new_tags: Dict) -> List[Dict]:
+    """List the fields that writing new_tags would change, as {field, old_value, new_value}
+    
+    A cover counts as a change only when the file has none yet.
+    """
+    changes = []
+    for field in ["title", "artist", "album", "genre", "year"]:
+        old_val = current_tags.get(field)
+        new_val = new_tags.get(field)
+        if old_val != new_val and new_val:
+            changes.append({
+                "field": field,
+                "old_value": old_val,
+                "new_value": new_val
+            })
+    
+    if not current_tags.get("has_cover") and new_tags.get("has_cover"):
+        changes.append({
+            "field": "cover_art",
+            "old_value": "None",
+            "new_value": "Will be added"
+        })
+    
+    return changes
+
+
 # Global tagger instance
 _tagger: Optional[AudioTagger] = None
 
@@ -571,10 +899,46 @@ def get_tagger() -> AudioTagger:
     return _tagger
 
 
-async def tag_track(track_id: int) -> bool:
-    """Apply matched metadata to a track file"""
+async def _write_matched_tags(track: Track) -> Dict:
+    """Write a track's matched metadata to its file and return the column updates"""
     tagger = get_tagger()
     
+    if not os.path.exists(track.filepath):
+        logger.error(f"File not found: {track.filepath}")
+        return {"status": "error", "error_message": "File not found"}
+    
+    logger.info(f"Tagging track: {track.filename}")
+    
+    try:
+        success = await tagger.tag_file(
+            filepath=track.filepath,
+            title=track.matched_title or track.title,
+            artist=track.matched_artist or track.artist,
+            album=track.matched_album or track.album,
+            genre=track.matched_genre or track.genre,
+            year=track.matched_year or track.year,
+            cover_url=track.matched_cover_url
+        )
+        
+        if success:
+            logger.info(f"Successfully tagged track {track.id}")
+            # Update current tags with matched values
+            return {
+                "status": "tagged",
+                "tagged_at": datetime.utcnow(),
+                "title": track.matched_title or track.title,
+                "artist": track.matched_artist or track.artist,
+                "genre": track.matched_genre or track.genre
+            }
+        return {"status": "error", "error_message": "Failed to write tags"}
+        
+    except Exception as e:
+        logger.error(f"Error tagging track {track.id}: {e}")
+        return {"status": "error", "error_message": str(e)}
+
+
+async def tag_track(track_id: int) -> bool:
+    """Apply matched metadata to a track file"""
     async with get_db() as db:
         result = await db.execute(select(Track).where(Track.id == track_id))
         track = result.scalar_one_or_none()
@@ -583,50 +947,41 @@ async def tag_track(track_id: int) -> bool:
             logger.error(f"Track {track_id} not found")
             return False
         
-        if not os.path.exists(track.filepath):
-            logger.error(f"File not found: {track.filepath}")
-            track.status = "error"
-            track.error_message = "File not found"
-            await db.commit()
-            return False
+        values = await _write_matched_tags(track)
+        for column, value in values.items():
+            setattr(track, column, value)
+        await db.commit()
         
-        logger.info(f"Tagging track: {track.filename}")
+        return values["status"] == "tagged"
+
+
+async def _record_track_updates(jobs: List):
+    """Await per-track jobs concurrently and write the column updates they return
+    
+    Each job returns a dict keyed by "id" (or None). Results are written on one
+    session with chunked bulk UPDATEs, committing every BULK_UPDATE_CHUNK rows so
+    the database keeps up with files already changed on disk.
+    """
+    async with get_db() as db:
+        pending = []
         
-        try:
-            success = await tagger.tag_file(
-                filepath=track.filepath,
-                title=track.matched_title or track.title,
-                artist=track.matched_artist or track.artist,
-                album=track.matched_album or track.album,
-                genre=track.matched_genre or track.genre,
-                year=track.matched_year or track.year,
-                cover_url=track.matched_cover_url
-            )
+        for next_job in asyncio.as_completed(jobs):
+            try:
+                values = await next_job
+            except Exception as e:
+                logger.error(f"Batch track job failed: {e}")
+                continue
             
-            if success:
-                track.status = "tagged"
-                track.tagged_at = datetime.utcnow()
-                
-                # Update current tags with matched values
-                track.title = track.matched_title or track.title
-                track.artist = track.matched_artist or track.artist
-                track.genre = track.matched_genre or track.genre
-                
+            if values:
+                pending.append(values)
+            if len(pending) >= BULK_UPDATE_CHUNK:
+                await db.execute(update(Track), pending)
                 await db.commit()
-                logger.info(f"Successfully tagged track {track_id}")
-                return True
-            else:
-                track.status = "error"
-                track.error_message = "Failed to write tags"
-                await db.commit()
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error tagging track {track_id}: {e}")
-            track.status = "error"
-            track.error_message = str(e)
+                pending = []
+        
+        if pending:
+            await db.execute(update(Track), pending)
             await db.commit()
-            return False
 
 
 async def batch_tag_tracks(
@@ -635,7 +990,7 @@ async def batch_tag_tracks(
 ):
     """Tag multiple tracks"""
     async with get_db() as db:
-        query = select(Track.id)
+        query = select(Track)
         
         if track_ids:
             query = query.where(Track.id.in_(track_ids))
@@ -645,12 +1000,41 @@ async def batch_tag_tracks(
             return
         
         result = await db.execute(query)
-        ids_to_tag = [row[0] for row in result.fetchall()]
+        tracks = result.scalars().all()
+    
+    logger.info(f"Batch tagging {len(tracks)} tracks")
+    
+    # Overlap cover downloads and file writes across tracks, recording results
+    # with bulk UPDATEs instead of a SELECT and commit per track
+    semaphore = asyncio.Semaphore(max(1, settings.tag_concurrency))
+    
+    async def tag_one(track: Track) -> Dict:
+        async with semaphore:
+            return {"id": track.id, **await _write_matched_tags(track)}
+    
+    # Fetch each distinct cover up front and concurrently, alongside the tagging
+    # stage; tag_file then finds them in the tagger's cover cache (or waits on the
+    # in-flight download). The list is capped so prefetched covers aren't evicted
+    cover_urls = list(dict.fromkeys(
+        track.matched_cover_url for track in tracks if track.matched_cover_url
+    ))[:COVER_CACHE_SIZE]
+    tagger = get_tagger()
+    cover_semaphore = asyncio.Semaphore(max(1, settings.tag_concurrency))
+    
+    async def prefetch_cover(url: str):
+        async with cover_semaphore:
+            await tagger.get_cover_art(url)
     
-    logger.info(f"Batch tagging {len(ids_to_tag)} tracks")
+    prefetch = asyncio.gather(*(prefetch_cover(url) for url in cover_urls), return_exceptions=True)
     
-    for track_id in ids_to_tag:
-        await tag_track(track_id)
+    try:
+        await _record_track_updates([tag_one(track) for track in tracks])
+    except BaseException:
+        # Don't leave cover downloads running (or their results unretrieved)
+        prefetch.cancel()
+        await asyncio.gather(prefetch, return_exceptions=True)
+        raise
+    await prefetch
 
 
 async def preview_tag_changes(track: Track) -> TagPreview:
@@ -668,23 +1052,7 @@ async def preview_tag_changes(track: Track) -> TagPreview:
         "has_cover": bool(track.matched_cover_url)
     }
     
-    changes = []
-    for field in ["title", "artist", "album", "genre", "year"]:
-        old_val = current_tags.get(field)
-        new_val = new_tags.get(field)
-        if old_val != new_val and new_val:
-            changes.append({
-                "field": field,
-                "old_value": old_val,
-                "new_value": new_val
-            })
-    
-    if not current_tags.get("has_cover") and new_tags.get("has_cover"):
-        changes.append({
-            "field": "cover_art",
-            "old_value": "None",
-            "new_value": "Will be added"
-        })
+    changes = diff_tags(current_tags, new_tags)
     
     return TagPreview(
         track_id=track.id,
@@ -695,15 +1063,22 @@ async def preview_tag_changes(track: Track) -> TagPreview:
     )
 
 
-async def rename_track_file(track: Track, new_filename: str) -> Tuple[bool, str]:
-    """Rename a track file"""
+# Characters dropped from renamed filenames: anything but letters, digits and " -_()".
+# \w is exactly str.isalnum() plus "_", so non-ASCII letters are kept as before.
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w \-()]")
+
+# Placeholders supported in batch rename patterns
+_RENAME_PLACEHOLDER_RE = re.compile(r"\{(?:artist|title|genre|year|dj|event)\}")
+
+
+def _rename_file_sync(old_path: str, new_filename: str) -> Tuple[bool, str]:
+    """Rename a file within its directory (blocking)"""
     try:
-        old_path = track.filepath
         directory = os.path.dirname(old_path)
         ext = Path(old_path).suffix
         
         # Sanitize filename
-        safe_filename = "".join(c for c in new_filename if c.isalnum() or c in " -_()").strip()
+        safe_filename = _UNSAFE_FILENAME_RE.sub("", new_filename).strip()
         new_path = os.path.join(directory, f"{safe_filename}{ext}")
         
         # Check if new path already exists
@@ -711,15 +1086,23 @@ async def rename_track_file(track: Track, new_filename: str) -> Tuple[bool, str]
             logger.error(f"File already exists: {new_path}")
             return False, old_path
         
-        # Rename file
-        shutil.move(old_path, new_path)
+        # Rename file - same directory, so a single rename syscall (no copy fallback needed)
+        os.replace(old_path, new_path)
         logger.info(f"Renamed: {old_path} -> {new_path}")
         
         return True, new_path
         
     except Exception as e:
         logger.error(f"Error renaming track: {e}")
-        return False, track.filepath
+        return False, old_path
+
+
+async def rename_track_file(track: Track, new_filename: str) -> Tuple[bool, str]:
+    """Rename a track file, running the filesystem calls in the I/O thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_tagger()._get_io_pool(), _rename_file_sync, track.filepath, new_filename
+    )
 
 
 async def batch_rename_tracks(
@@ -740,33 +1123,36 @@ async def batch_rename_tracks(
     
     logger.info(f"Batch renaming {len(tracks)} tracks with pattern: {pattern}")
     
-    for track in tracks:
-        # Build new filename from pattern
-        new_filename = pattern
-        
-        replacements = {
-            "{artist}": track.matched_artist or track.artist or "Unknown Artist",
-            "{title}": track.matched_title or track.title or "Unknown Title",
-            "{genre}": track.matched_genre or track.genre or "Unknown Genre",
-            "{year}": track.matched_year or track.year or "",
-            "{dj}": track.matched_dj or "",
-            "{event}": track.matched_event or ""
-        }
-        
-        for placeholder, value in replacements.items():
-            new_filename = new_filename.replace(placeholder, value)
-        
-        # Clean up the filename
-        new_filename = new_filename.strip(" -")
-        
-        if new_filename:
-            success, new_path = await rename_track_file(track, new_filename)
+    # One rename at a time: two tracks renamed to the same name concurrently
+    # could both pass the exists check, and the second would replace the first
+    rename_lock = asyncio.Lock()
+    
+    async def rename_one(track: Track) -> Optional[Dict]:
+        async with rename_lock:
+            # Build new filename from pattern
+            replacements = {
+                "{artist}": track.matched_artist or track.artist or "Unknown Artist",
+                "{title}": track.matched_title or track.title or "Unknown Title",
+                "{genre}": track.matched_genre or track.genre or "Unknown Genre",
+                "{year}": track.matched_year or track.year or "",
+                "{dj}": track.matched_dj or "",
+                "{event}": track.matched_event or ""
+            }
+            
+            new_filename = _RENAME_PLACEHOLDER_RE.sub(lambda m: replacements[m.group(0)], pattern)
+            
+            # Clean up the filename
+            new_filename = new_filename.strip(" -")
             
-            if success:
-                async with get_db() as db:
-                    result = await db.execute(select(Track).where(Track.id == track.id))
-                    db_track = result.scalar_one_or_none()
-                    if db_track:
-                        db_track.filepath = new_path
-                        db_track.filename = os.path.basename(new_path)
-                        await db.commit()
+            if new_filename:
+                success, new_path = await rename_track_file(track, new_filename)
+                
+                if success:
+                    return {
+                        "id": track.id,
+                        "filepath": new_path,
+                        "filename": os.path.basename(new_path)
+                    }
+            return None
+    
+    await _record_track_updates([rename_one(track) for track in tracks])
@@ -6,95 +6,316 @@ Based on https://github.com/jvenuto80/1001-tracklists-api
 import re
 import asyncio
 import random
+from functools import partial
+from weakref import WeakKeyDictionary
 from typing import List, Dict, Optional, Any
-from urllib.parse import quote_plus
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, Browser, Page
+from urllib.parse import quote_plus, urlencode
+from bs4 import BeautifulSoup, SoupStrainer
+from cachetools import TTLCache
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from backend.config import settings
 from loguru import logger
 
 
+# Links into a tracklist page (search results, DJ and source pages)
+TRACKLIST_HREF_RE = re.compile(r"/tracklist/")
+
+# Search endpoint per search type
+SEARCH_ENDPOINTS = {
+    "tracklists": "tracklist.php",
+    "tracks": "track.php",
+    "djs": "dj.php",
+    "all": "result.php",
+}
+
+# Source page slugs: "Group Therapy!" -> "group-therapy"
+SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+SLUG_SPACE_RE = re.compile(r'\s+')
+
+# Show name followed by an episode number, e.g. "Group Therapy 550"
+EPISODE_QUERY_RE = re.compile(r'(.+?)[\s_-]*(\d{2,4})[\s_-]*$')
+
+# DJ and source pages are only ever read for their tracklist links, so build
+# just those <a> tags instead of the whole document
+TRACKLIST_LINKS_STRAINER = SoupStrainer("a", href=TRACKLIST_HREF_RE)
+
+# Page text that means we got a challenge/block page instead of content.
+# Matched case-insensitively in one pass, without lowercasing the page.
+CAPTCHA_RE = re.compile(
+    r"turnstile-container"
+    r"|please verify you are human"
+    r"|access denied"
+    r"|please wait, you will be forwarded",
+    re.IGNORECASE
+)
+TURNSTILE_RE = re.compile(r"turnstile", re.IGNORECASE)
+
+# Subresources the parsers never look at. Blocking them keeps page loads light
+# and lets "networkidle" settle sooner. Scripts are left alone because the
+# Turnstile challenge runs on them.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+
+async def _block_heavy_resources(route):
+    """Playwright route handler that aborts images, media, fonts and styles"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES and "challenges.cloudflare.com" not in request.url:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Elements whose presence means a page has rendered enough to parse
+SEARCH_READY_SELECTOR = "div.tlLink, div.tlpItem, a[href*='/tracklist/']"
+TRACKLIST_READY_SELECTOR = "div#left, div.tlpItem"
+LINKS_READY_SELECTOR = "a[href*='/tracklist/']"
+
+# Track count in the left pane, e.g. "IDed 23/25 short"
+NUM_TRACKS_RE = re.compile(r"IDed[^/]*/\s*(\d+)")
+IDED_RE = re.compile(r"IDed")
+
+# Parsed pages are kept briefly so repeat lookups (the same DJ, source or
+# tracklist across tracks in a batch) skip the browser and the parse
+PAGE_CACHE_SIZE = 64
+PAGE_CACHE_TTL = 600  # seconds
+
+
 class CaptchaException(Exception):
     """Raised when a captcha is detected"""
     pass
 
 
+class RateLimitedException(Exception):
+    """Raised when the site answers with HTTP 429"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class TracklistsAPI:
     """Async wrapper for 1001Tracklists.com scraping using Playwright"""
     
     BASE_URL = "https://www.1001tracklists.com"
     SEARCH_URL = "https://www.1001tracklists.com/search/result.php"
+    USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     
     def __init__(self):
         self._playwright = None
         self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+        # Idle pages kept open between fetches (never more than the page semaphore allows)
+        self._idle_pages: List[Page] = []
         self.delay = settings.tracklists_delay
         self.max_retries = 3
         self.captcha_detected = False
+        # Bounds concurrent page loads; the per-request delay is taken inside it
+        self._page_semaphore = asyncio.Semaphore(settings.tracklists_concurrency)
+        self._browser_lock = asyncio.Lock()
+        # Page loads are paced from a shared schedule rather than each caller
+        # sleeping a fixed delay, so cache hits and idle periods cost nothing
+        self._pace_lock = asyncio.Lock()
+        self._next_request_at = 0.0
+        self._page_cache: TTLCache = TTLCache(maxsize=PAGE_CACHE_SIZE, ttl=PAGE_CACHE_TTL)
     
     async def _get_browser(self) -> Browser:
         """Get or create browser instance"""
-        if self._browser is None or not self._browser.is_connected():
-            if self._playwright is None:
-                self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--no-first-run',
-                    '--no-zygote',
-                    '--disable-gpu'
-                ]
-            )
-        return self._browser
+        # Concurrent fetches must not each launch their own browser
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=[
+                        '--no-sandbox',
+                        '--disable-setuid-sandbox',
+                        '--disable-dev-shm-usage',
+                        '--disable-accelerated-2d-canvas',
+                        '--no-first-run',
+                        '--no-zygote',
+                        '--disable-gpu'
+                    ]
+                )
+                self._context = None
+            return self._browser
+    
+    async def _get_context(self) -> BrowserContext:
+        """Get or create the browser context shared by all page loads
+        
+        browser.new_page() spins up a throwaway context per call, so every fetch
+        started with a cold connection pool, DNS cache and cookie jar (including
+        Cloudflare's clearance cookie). One long-lived context keeps those warm.
+        """
+        browser = await self._get_browser()
+        async with self._browser_lock:
+            if self._context is None:
+                self._context = await browser.new_context(user_agent=self.USER_AGENT)
+                await self._context.route("**/*", _block_heavy_resources)
+            return self._context
     
     def _detect_captcha(self, text: str) -> bool:
         """Detect various forms of captcha/blocking"""
-        captcha_indicators = [
-            "turnstile-container" in text.lower(),
-            "please verify you are human" in text.lower(),
-            "access denied" in text.lower(),
-            "please wait, you will be forwarded" in text.lower(),
-        ]
-        return any(captcha_indicators)
-    
-    async def _get_soup(self, url: str, wait_for_content: bool = True) -> BeautifulSoup:
-        """Fetch URL using Playwright and return BeautifulSoup object"""
-        browser = await self._get_browser()
-        page = await browser.new_page(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        return CAPTCHA_RE.search(text) is not None
+    
+    async def _get_soup(
+        self,
+        url: str,
+        wait_for_content: bool = True,
+        parse_only: Optional[SoupStrainer] = None,
+        ready_selector: Optional[str] = None,
+        content_selector: Optional[str] = None
+    ) -> BeautifulSoup:
+        """
+        Fetch URL using Playwright and return BeautifulSoup object
+        
+        Args:
+            url: Page to fetch
+            wait_for_content: Give dynamic content a moment to render
+            parse_only: Optional strainer limiting which tags are built. The
+                page cache is keyed by URL, so a given URL must always be
+                fetched with the same strainer.
+            ready_selector: Optional selector to wait for instead of the
+                fixed wait_for_content pause
+            content_selector: Optional element whose outerHTML is parsed
+                instead of the whole document (e.g. "body" when nothing in
+                <head> is needed)
+        """
+        soup = self._page_cache.get(url)
+        if soup is not None:
+            logger.debug(f"Page cache hit: {url}")
+            return soup
+        
+        # Only the browser work holds a page slot; parsing happens after the
+        # page is closed so the next fetch can start while this one parses
+        for attempt in range(self.max_retries):
+            try:
+                async with self._page_semaphore:
+                    text = await self._fetch_html(url, wait_for_content, ready_selector, content_selector)
+                break
+            except (CaptchaException, RateLimitedException) as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                backoff = min(30.0, self.delay * 2 ** attempt) + random.random()
+                if isinstance(e, RateLimitedException) and e.retry_after:
+                    backoff = max(backoff, e.retry_after)
+                logger.info(f"Retrying {url} in {backoff:.1f}s ({e})")
+                await asyncio.sleep(backoff)
+        
+        # A large tracklist page takes a noticeable while to build into a soup,
+        # so do it off the event loop to keep sibling fetches moving
+        loop = asyncio.get_running_loop()
+        soup = await loop.run_in_executor(
+            None, partial(BeautifulSoup, text, "lxml", parse_only=parse_only)
         )
         
+        # Log page title for debugging
+        if soup.title:
+            logger.debug(f"Page title: {soup.title.text}")
+        
+        self._page_cache[url] = soup
+        return soup
+    
+    def invalidate(self, url: Optional[str] = None):
+        """Drop a cached page, or every cached page when no URL is given"""
+        if url is None:
+            self._page_cache.clear()
+        else:
+            self._page_cache.pop(url, None)
+    
+    async def _pace(self):
+        """Wait until the next page load is allowed to start
+        
+        Navigations are spaced at least `delay` seconds apart (plus a little
+        jitter to seem more human) across all concurrent fetches.
+        """
+        async with self._pace_lock:
+            loop = asyncio.get_running_loop()
+            wait = self._next_request_at - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_request_at = loop.time() + self.delay + random.uniform(0.5, 2.0)
+    
+    async def _acquire_page(self) -> Page:
+        """Take an idle page from the pool, or open a new one"""
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            # Pages from a previous (crashed or relaunched) browser are dead
+            if not page.is_closed():
+                return page
+        context = await self._get_context()
+        return await context.new_page()
+    
+    async def _release_page(self, page: Page, reusable: bool):
+        """Return a page to the pool after a clean fetch, otherwise close it"""
+        try:
+            if reusable and not page.is_closed():
+                # Unload the site so scripts and timers stop running while idle
+                await page.goto("about:blank")
+                self._idle_pages.append(page)
+                return
+            await page.close()
+        except Exception as e:
+            logger.debug(f"Error releasing page: {e}")
+    
+    async def _read_html(self, page: Page, content_selector: Optional[str]) -> str:
+        """Get the page HTML, sliced to content_selector when it is present"""
+        if content_selector:
+            html = await page.evaluate(
+                "(sel) => { const el = document.querySelector(sel); return el ? el.outerHTML : null; }",
+                content_selector
+            )
+            if html:
+                return html
+        return await page.content()
+    
+    async def _fetch_html(
+        self,
+        url: str,
+        wait_for_content: bool,
+        ready_selector: Optional[str] = None,
+        content_selector: Optional[str] = None
+    ) -> str:
+        """Load a single page and return its HTML (callers hold the page semaphore)"""
+        await self._pace()
+        page = await self._acquire_page()
+        reusable = False
+        
         try:
-            # Add random delay to seem more human
-            delay = self.delay + random.uniform(0.5, 2.0)
-            await asyncio.sleep(delay)
-            
             logger.debug(f"Navigating to {url}")
-            await page.goto(url, wait_until="networkidle", timeout=30000)
+            # With a ready selector there is no need to wait for the network to
+            # go quiet (analytics beacons keep it busy long after the content)
+            wait_until = "domcontentloaded" if ready_selector else "networkidle"
+            response = await page.goto(url, wait_until=wait_until, timeout=30000)
+            if response and response.status == 429:
+                retry_after = response.headers.get("retry-after")
+                raise RateLimitedException(
+                    f"HTTP 429 from {url}",
+                    float(retry_after) if retry_after and retry_after.isdigit() else None
+                )
             
             # Wait for any Cloudflare challenge to resolve
             # Turnstile usually completes within 5-10 seconds
             try:
-                await page.wait_for_selector("body", timeout=5000)
-                # Wait a bit more for dynamic content
-                if wait_for_content:
-                    await asyncio.sleep(3)
+                if ready_selector:
+                    await page.wait_for_selector(ready_selector, timeout=8000)
+                else:
+                    await page.wait_for_selector("body", timeout=5000)
+                    # Wait a bit more for dynamic content
+                    if wait_for_content:
+                        await asyncio.sleep(3)
             except Exception:
                 pass
             
             # Get page content
-            text = await page.content()
+            text = await self._read_html(page, content_selector)
             
             # Check for captcha that didn't resolve
-            if self._detect_captcha(text) and "turnstile" in text.lower():
+            if self._detect_captcha(text) and TURNSTILE_RE.search(text):
                 # Wait longer for turnstile to complete
                 logger.info("Waiting for Turnstile captcha to resolve...")
                 await asyncio.sleep(10)
-                text = await page.content()
+                text = await self._read_html(page, content_selector)
                 
                 if self._detect_captcha(text):
                     self.captcha_detected = True
@@ -102,21 +323,16 @@ class TracklistsAPI:
                     raise CaptchaException("Turnstile captcha could not be automatically resolved")
             
             self.captcha_detected = False
-            soup = BeautifulSoup(text, "lxml")
-            
-            # Log page title for debugging
-            if soup.title:
-                logger.debug(f"Page title: {soup.title.text}")
-            
-            return soup
+            reusable = True
+            return text
             
-        except CaptchaException:
+        except (CaptchaException, RateLimitedException):
             raise
         except Exception as e:
             logger.error(f"Error fetching {url}: {e}")
             raise
         finally:
-            await page.close()
+            await self._release_page(page, reusable)
     
     async def search(self, query: str, search_type: str = "all") -> List[Dict]:
         """
@@ -129,23 +345,13 @@ class TracklistsAPI:
         Returns:
             List of search results
         """
-        encoded_query = quote_plus(query)
-        
         # 1001tracklists uses different endpoints for different searches
-        search_urls = {
-            "tracklists": f"{self.BASE_URL}/search/tracklist.php?q={encoded_query}",
-            "tracks": f"{self.BASE_URL}/search/track.php?q={encoded_query}",
-            "djs": f"{self.BASE_URL}/search/dj.php?q={encoded_query}",
-            "all": f"{self.BASE_URL}/search/result.php?q={encoded_query}"
-        }
-        
-        url = search_urls.get(search_type, search_urls["all"])
+        endpoint = SEARCH_ENDPOINTS.get(search_type, SEARCH_ENDPOINTS["all"])
+        url = f"{self.BASE_URL}/search/{endpoint}?{urlencode({'q': query})}"
         logger.info(f"Searching 1001tracklists: {url}")
         
-        await asyncio.sleep(self.delay)  # Rate limiting
-        
         try:
-            soup = await self._get_soup(url)
+            soup = await self._get_soup(url, ready_selector=SEARCH_READY_SELECTOR, content_selector="body")
             results = []
             
             # Log page title for debugging
@@ -153,12 +359,19 @@ class TracklistsAPI:
                 logger.debug(f"Page title: {soup.title.text}")
             
             # Parse search results based on type
-            if search_type == "tracklists" or search_type == "all":
+            if search_type == "all":
+                tracklist_results, track_results = self._parse_all_search_results(soup)
+                logger.info(f"Found {len(tracklist_results)} tracklist results")
+                logger.info(f"Found {len(track_results)} track results")
+                results.extend(tracklist_results)
+                results.extend(track_results)
+            
+            if search_type == "tracklists":
                 tracklist_results = self._parse_tracklist_search_results(soup)
                 logger.info(f"Found {len(tracklist_results)} tracklist results")
                 results.extend(tracklist_results)
             
-            if search_type == "tracks" or search_type == "all":
+            if search_type == "tracks":
                 track_results = self._parse_track_search_results(soup)
                 logger.info(f"Found {len(track_results)} track results")
                 results.extend(track_results)
@@ -170,7 +383,19 @@ class TracklistsAPI:
                 logger.info(f"Found {len(alt_results)} results from alternative parsing")
                 results.extend(alt_results)
             
-            return results
+            # Drop repeated links (a set is often listed more than once) so
+            # callers get each URL once; results without a URL are kept as-is
+            seen_urls = set()
+            unique_results = []
+            for r in results:
+                result_url = r.get("url")
+                if result_url:
+                    if result_url in seen_urls:
+                        continue
+                    seen_urls.add(result_url)
+                unique_results.append(r)
+            
+            return unique_results
             
         except Exception as e:
             logger.error(f"Search error: {e}")
@@ -182,7 +407,7 @@ class TracklistsAPI:
         seen_urls = set()
         
         # Look for any links containing /tracklist/
-        for link in soup.find_all("a", href=re.compile(r"/tracklist/")):
+        for link in soup.find_all("a", href=TRACKLIST_HREF_RE):
             try:
                 href = link.get("href", "")
                 if href in seen_urls:
@@ -206,88 +431,123 @@ class TracklistsAPI:
         
         return results
     
+    def _parse_all_search_results(self, soup: BeautifulSoup) -> tuple[List[Dict], List[Dict]]:
+        """
+        Parse tracklist and track search results in a single walk of the page
+        
+        Returns:
+            Tuple of (tracklist_results, track_results)
+        """
+        tracklist_results = []
+        track_results = []
+        
+        for item in soup.find_all("div", class_=["tlLink", "tlpItem"]):
+            if "tlLink" in item.get("class", []):
+                result = self._parse_tracklist_item(item)
+                if result:
+                    tracklist_results.append(result)
+            else:
+                result = self._parse_track_item(item)
+                if result:
+                    track_results.append(result)
+        
+        return tracklist_results, track_results
+    
     def _parse_tracklist_search_results(self, soup: BeautifulSoup) -> List[Dict]:
         """Parse tracklist search results from page"""
         results = []
         
         # Find tracklist links
         for item in soup.find_all("div", class_="tlLink"):
-            try:
-                link = item.find("a")
-                if not link:
-                    continue
-                
-                title = link.text.strip()
-                url = link.get("href", "")
-                if not url.startswith("http"):
-                    url = self.BASE_URL + url
-                
-                # Try to extract DJ name
-                dj = None
-                dj_elem = item.find("span", class_="artistName")
-                if dj_elem:
-                    dj = dj_elem.text.strip()
-                
-                results.append({
-                    "type": "tracklist",
-                    "title": title,
-                    "url": url,
-                    "dj": dj
-                })
-                
-            except Exception as e:
-                logger.debug(f"Error parsing tracklist result: {e}")
+            result = self._parse_tracklist_item(item)
+            if result:
+                results.append(result)
         
         return results
     
+    def _parse_tracklist_item(self, item: BeautifulSoup) -> Optional[Dict]:
+        """Parse a single tracklist search result (div.tlLink)"""
+        try:
+            link = item.find("a")
+            if not link:
+                return None
+            
+            title = link.text.strip()
+            url = link.get("href", "")
+            if not url.startswith("http"):
+                url = self.BASE_URL + url
+            
+            # Try to extract DJ name
+            dj = None
+            dj_elem = item.find("span", class_="artistName")
+            if dj_elem:
+                dj = dj_elem.text.strip()
+            
+            return {
+                "type": "tracklist",
+                "title": title,
+                "url": url,
+                "dj": dj
+            }
+            
+        except Exception as e:
+            logger.debug(f"Error parsing tracklist result: {e}")
+            return None
+    
     def _parse_track_search_results(self, soup: BeautifulSoup) -> List[Dict]:
         """Parse track search results from page"""
         results = []
         
         # Find track items
         for item in soup.find_all("div", class_="tlpItem"):
-            try:
-                track_info = self._parse_track_div(item)
-                if track_info:
-                    track_info["type"] = "track"
-                    results.append(track_info)
-            except Exception as e:
-                logger.debug(f"Error parsing track result: {e}")
+            result = self._parse_track_item(item)
+            if result:
+                results.append(result)
         
         return results
     
+    def _parse_track_item(self, item: BeautifulSoup) -> Optional[Dict]:
+        """Parse a single track search result (div.tlpItem)"""
+        try:
+            track_info = self._parse_track_div(item)
+            if track_info:
+                track_info["type"] = "track"
+            return track_info
+        except Exception as e:
+            logger.debug(f"Error parsing track result: {e}")
+            return None
+    
     def _parse_track_div(self, div: BeautifulSoup) -> Optional[Dict]:
         """Parse individual track div"""
         try:
-            track_value = div.find("span", class_="trackValue")
+            # Collect the title, metadata and labels in a single walk of the div
+            track_value = None
+            meta_data = {}
+            labels = []
+            for node in div.find_all(["span", "meta"]):
+                if node.name == "meta":
+                    itemprop = node.get("itemprop")
+                    content = node.get("content")
+                    if itemprop and content:
+                        meta_data[itemprop] = content
+                elif node.get("title") == "label":
+                    labels.append(node.text.strip())
+                elif track_value is None and "trackValue" in node.get("class", []):
+                    track_value = node
+            
             if not track_value:
                 return None
             
             full_title = track_value.text.strip().replace('\xa0', ' ')
             
             # Split into artist and title
-            if " - " in full_title:
-                artist, title = full_title.split(" - ", 1)
-            else:
-                artist = None
-                title = full_title
-            
-            # Get metadata
-            meta_data = {}
-            for meta in div.find_all("meta"):
-                itemprop = meta.get("itemprop")
-                content = meta.get("content")
-                if itemprop and content:
-                    meta_data[itemprop] = content
+            artist, sep, title = full_title.partition(" - ")
+            if not sep:
+                artist, title = None, full_title
             
             genre = meta_data.get("genre")
             url = meta_data.get("url")
             
-            # Get label
-            labels = []
-            for label_span in div.find_all("span", title="label"):
-                labels.append(label_span.text.strip())
-            
             return {
                 "full_title": full_title,
                 "title": title,
@@ -311,52 +571,86 @@ class TracklistsAPI:
         Returns:
             Dictionary with tracklist details
         """
-        await asyncio.sleep(self.delay)  # Rate limiting
-        
         try:
-            soup = await self._get_soup(url)
+            soup = await self._get_soup(url, ready_selector=TRACKLIST_READY_SELECTOR)
             
-            # Get title
-            title = soup.title.text if soup.title else ""
-            
-            # Get tracklist ID from URL
-            tracklist_id = url.split("tracklist/")[1].split("/")[0] if "tracklist/" in url else None
-            
-            # Get left pane metadata
-            left_pane = soup.find("div", id="left")
-            metadata = self._parse_tracklist_metadata(left_pane) if left_pane else {}
-            
-            # Get tracks
-            tracks = []
-            track_divs = soup.find_all("div", class_="tlpItem")
-            for track_div in track_divs:
-                track_info = self._parse_track_div(track_div)
-                if track_info:
-                    tracks.append(track_info)
-            
-            # Get cue times
-            cues = [div.text.strip() for div in soup.find_all("div", class_="cueValueField")]
-            
-            # Get cover image
-            cover_url = None
-            og_image = soup.find("meta", property="og:image")
-            if og_image:
-                cover_url = og_image.get("content")
-            
-            return {
-                "tracklist_id": tracklist_id,
-                "url": url,
-                "title": title,
-                "tracks": tracks,
-                "cues": cues,
-                "cover_url": cover_url,
-                **metadata
-            }
+            # Walking a few hundred track divs is pure Python; do it off the
+            # event loop so concurrent fetches aren't stalled behind it
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._parse_tracklist_page, soup, url)
             
         except Exception as e:
             logger.error(f"Error fetching tracklist {url}: {e}")
             return None
     
+    def _parse_tracklist_page(self, soup: BeautifulSoup, url: str) -> Dict:
+        """Extract tracklist details from a parsed tracklist page"""
+        # Get title
+        title = soup.title.text if soup.title else ""
+        
+        # Get tracklist ID from URL
+        tracklist_id = url.split("tracklist/")[1].split("/")[0] if "tracklist/" in url else None
+        
+        # Get left pane metadata
+        left_pane = soup.find("div", id="left")
+        metadata = self._parse_tracklist_metadata(left_pane) if left_pane else {}
+        
+        # Get tracks and cue times in one walk of the document
+        tracks = []
+        cues = []
+        for div in soup.find_all("div", class_=["tlpItem", "cueValueField"]):
+            classes = div.get("class", [])
+            if "tlpItem" in classes:
+                track_info = self._parse_track_div(div)
+                if track_info:
+                    tracks.append(track_info)
+            if "cueValueField" in classes:
+                cues.append(div.text.strip())
+        
+        # Get cover image (a <head> tag, so don't search the body for it)
+        cover_url = None
+        og_image = (soup.head or soup).find("meta", property="og:image")
+        if og_image:
+            cover_url = og_image.get("content")
+        
+        return {
+            "tracklist_id": tracklist_id,
+            "url": url,
+            "title": title,
+            "tracks": tracks,
+            "cues": cues,
+            "cover_url": cover_url,
+            **metadata
+        }
+    
+    async def get_tracklists(self, urls: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch several tracklists concurrently
+        
+        Page loads are bounded by the page semaphore, so at most
+        tracklists_concurrency pages are open at once and each still
+        waits out the rate-limit delay.
+        
+        Args:
+            urls: Tracklist page URLs
+            
+        Returns:
+            Dictionary mapping each URL to its details (None on failure)
+        """
+        urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(
+            *(self.get_tracklist(url) for url in urls),
+            return_exceptions=True
+        )
+        
+        tracklists = {}
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching tracklist {url}: {result}")
+                result = None
+            tracklists[url] = result
+        return tracklists
+    
     def _parse_tracklist_metadata(self, left_pane: BeautifulSoup) -> Dict:
         """Parse metadata from tracklist left pane"""
         metadata = {
@@ -397,13 +691,17 @@ class TracklistsAPI:
                             metadata["sources"][str(source_type).strip()] = name
             
             # Get track count
-            text = left_pane.text
-            if "IDed" in text:
-                try:
-                    total = text.split("IDed")[1].split("short")[0].strip().split("/")[1].split()[0]
-                    metadata["num_tracks"] = int(total)
-                except:
-                    pass
+            # Read only the cell holding the "IDed" counter; the pane's full
+            # text concatenates every string in it
+            num_tracks = None
+            ided = left_pane.find(string=IDED_RE)
+            if ided:
+                cell = ided.find_parent("td") or ided.parent
+                num_tracks = NUM_TRACKS_RE.search(cell.get_text(" "))
+                if not num_tracks:
+                    num_tracks = NUM_TRACKS_RE.search(left_pane.text)
+            if num_tracks:
+                metadata["num_tracks"] = int(num_tracks.group(1))
                     
         except Exception as e:
             logger.debug(f"Error parsing tracklist metadata: {e}")
@@ -415,16 +713,19 @@ class TracklistsAPI:
         encoded_name = quote_plus(dj_name)
         url = f"{self.BASE_URL}/dj/{encoded_name}/index.html"
         
-        await asyncio.sleep(self.delay)
-        
         try:
-            soup = await self._get_soup(url)
+            soup = await self._get_soup(
+                url,
+                parse_only=TRACKLIST_LINKS_STRAINER,
+                ready_selector=LINKS_READY_SELECTOR,
+                content_selector="body"
+            )
             
             # Try to find DJ page redirect
             results = []
             
             # Look for tracklist links on DJ page
-            for link in soup.find_all("a", href=re.compile(r"/tracklist/")):
+            for link in soup.find_all("a", href=TRACKLIST_HREF_RE):
                 title = link.text.strip()
                 href = link.get("href", "")
                 if href and not href.startswith("http"):
@@ -444,8 +745,24 @@ class TracklistsAPI:
             logger.error(f"Error searching for DJ {dj_name}: {e}")
             return []
     
+    async def startup(self):
+        """Launch the browser and open the shared context ahead of the first fetch"""
+        await self._get_context()
+    
+    async def __aenter__(self) -> "TracklistsAPI":
+        await self.startup()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
     async def close(self):
         """Close the Playwright browser and stop playwright"""
+        # Closing the context closes its pages
+        self._idle_pages.clear()
+        if self._context:
+            await self._context.close()
+            self._context = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -460,16 +777,19 @@ class TracklistsAPI:
         """
         # Normalize source name for URL
         normalized = source_name.lower()
-        normalized = re.sub(r'[^\w\s-]', '', normalized)
-        normalized = re.sub(r'\s+', '-', normalized)
+        normalized = SLUG_STRIP_RE.sub('', normalized)
+        normalized = SLUG_SPACE_RE.sub('-', normalized)
         
         url = f"{self.BASE_URL}/source/{normalized}/index.html"
         logger.info(f"Trying source URL: {url}")
         
-        await asyncio.sleep(self.delay)
-        
         try:
-            soup = await self._get_soup(url)
+            soup = await self._get_soup(
+                url,
+                parse_only=TRACKLIST_LINKS_STRAINER,
+                ready_selector=LINKS_READY_SELECTOR,
+                content_selector="body"
+            )
             return self._parse_any_tracklist_links(soup)
         except Exception as e:
             logger.error(f"Error searching source {source_name}: {e}")
@@ -485,13 +805,16 @@ class TracklistsAPI:
         # 1. Try standard search
         logger.info(f"Trying standard search for: {query}")
         results = await self.search(query, "tracklists")
-        for r in results:
-            if r.get("url") not in seen_urls:
-                seen_urls.add(r.get("url"))
-                all_results.append(r)
         
-        # 2. If query looks like a show name with episode number, try source search
-        show_match = re.match(r'(.+?)[\s_-]*(\d{2,4})[\s_-]*$', query)
+        # search() already returns each URL once
+        all_results.extend(results)
+        seen_urls.update(r.get("url") for r in results)
+        
+        # 2. If the query looks like a show name with episode number and the
+        # standard search found nothing, fall back to the show's source page.
+        # Only then: it costs another paced page load. Source pages are per
+        # show, so later episodes hit the page cache.
+        show_match = EPISODE_QUERY_RE.match(query)
         if show_match and not all_results:
             show_name = show_match.group(1).strip()
             episode = show_match.group(2)
@@ -507,16 +830,28 @@ class TracklistsAPI:
         return all_results
 
 
-# Global API instance
-_api: Optional[TracklistsAPI] = None
+# One API instance per event loop. Its browser, page pool and asyncio
+# locks/semaphores belong to the loop they were created on, so a second loop
+# (tests, worker threads) gets its own instead of hanging on a foreign one.
+# Loops are held weakly so a closed loop's entry goes away with it.
+_apis: WeakKeyDictionary = WeakKeyDictionary()
 
 
 def get_tracklists_api() -> TracklistsAPI:
-    """Get or create TracklistsAPI instance"""
-    global _api
-    if _api is None:
-        _api = TracklistsAPI()
-    return _api
+    """Get or create the TracklistsAPI instance for the running event loop"""
+    loop = asyncio.get_running_loop()
+    api = _apis.get(loop)
+    if api is None:
+        # No await between the lookup and the store, so this can't race
+        api = _apis[loop] = TracklistsAPI()
+    return api
+
+
+async def close_tracklists_api():
+    """Shut down this event loop's TracklistsAPI browser if one was started"""
+    api = _apis.pop(asyncio.get_running_loop(), None)
+    if api is not None:
+        await api.close()
 
 
 async def search_1001tracklists(query: str) -> List[Dict]:
@@ -530,3 +865,9 @@ async def get_tracklist_details(url: str) -> Optional[Dict]:
     """Convenience function to get tracklist details"""
     api = get_tracklists_api()
     return await api.get_tracklist(url)
+
+
+async def get_tracklists_details(urls: List[str]) -> Dict[str, Optional[Dict]]:
+    """Convenience function to get details for several tracklists at once"""
+    api = get_tracklists_api()
+    return await api.get_tracklists(urls)